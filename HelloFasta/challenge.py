@@ -1,5 +1,8 @@
 # https://github.com/elmar-hinz/Python.Challenges
+import random
+
 from challenges import Challenge
+from challenges.sequence import best_match
 
 class HelloFastaChallenge(Challenge):
     """
@@ -22,19 +25,20 @@ class HelloFastaChallenge(Challenge):
 
     expect = 'Fasta2'
 
+    @classmethod
+    def generate(cls, n):
+        """Generate a strand followed by n fasta reads."""
+        generator = random.Random(n)
+        strand = ''.join(generator.choice('ACGT') for _ in range(60))
+        lines = [strand]
+        for i in range(n):
+            read = ''.join(generator.choice('ACGT') for _ in range(60))
+            lines += ['>Fasta{}'.format(i), read[:30], read[30:]]
+        return '\n'.join(lines)
+
     def build(self):
         self.model.strand = self.line(0)
         self.model.fasta = self.fasta(1)
 
     def calc(self):
-        winner = None
-        maximum = 0
-        for id, strand in self.model.fasta:
-            counter = 0
-            for position, base in enumerate(self.model.strand):
-                if strand[position] == base:
-                    counter += 1
-            if counter > maximum:
-                maximum = counter
-                winner = id
-        self.result = winner
\ No newline at end of file
+        self.result = best_match(self.model.strand, self.model.fasta)
\ No newline at end of file
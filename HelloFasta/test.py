@@ -19,6 +19,11 @@ class HelloFastaTest(unittest.TestCase):
         self.assertEqual('Fasta3', fasta[2][0])
         self.assertEqual('ACCGTTTT', fasta[2][1])
 
+    def test_generate(self):
+        self.challenge.sample = HelloFastaChallenge.generate(100)
+        self.challenge.main()
+        self.assertTrue(self.challenge.output.startswith('Fasta'))
+
     def test_full_integration(self):
         self.challenge.main()
         self.assertEqual(self.challenge.expectation(), self.challenge.output)
\ No newline at end of file
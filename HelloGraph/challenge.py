@@ -22,6 +22,14 @@ class HelloGraphChallenge(Challenge):
         14
     '''
 
+    @classmethod
+    def generate(cls, n):
+        """Generate a weighted path of n edges from node 1 to n + 1."""
+        lines = ['1', str(n + 1)]
+        lines += ['{}->{}:{}'.format(i, i + 1, i % 10)
+                  for i in range(1, n + 1)]
+        return '\n'.join(lines)
+
     def build(self):
         self.model = self.lines_to_graph(start=2)
         self.model.start = self.line_to_integer(0)
@@ -25,6 +25,11 @@ class HelloGraphTest(unittest.TestCase):
         self.challenge.format()
         self.assertEqual(self.challenge.expectation(), self.challenge.output)
 
+    def test_generate(self):
+        self.challenge.sample = HelloGraphChallenge.generate(100)
+        self.challenge.main()
+        self.assertEqual(101, len(self.challenge.result.path))
+
     def test_full_integration(self):
         self.challenge.main()
         self.assertEqual(self.challenge.expectation(), self.challenge.output)
\ No newline at end of file
@@ -71,6 +71,15 @@ class HelloWorldChallenge(Challenge):
         It is used by unit tests, especially by the full integration test.
     """
 
+    @classmethod
+    def generate(cls, n):
+        """Generate a word of length n to benchmark the challenge.
+
+            prompt> challenge HelloWorld --bench
+        """
+        word = ('World' * (n // 5 + 1))[:n]
+        return '{}\n{}'.format(n // 2, word)
+
     def build(self):
         """Parse the input lines and set up the model."""
         self.model.split_at = self.line_to_integers(0)[0]
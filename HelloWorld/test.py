@@ -32,6 +32,11 @@ class HelloWorldTest(unittest.TestCase):
         self.challenge.format()
         self.assertEqual(self.challenge.expectation(), self.challenge.output)
 
+    def test_generate(self):
+        self.challenge.sample = HelloWorldChallenge.generate(10)
+        self.challenge.main()
+        self.assertEqual('World World\n11', self.challenge.output)
+
     def test_full_integration(self):
         self.challenge.main()
         self.assertEqual(self.challenge.expectation(), self.challenge.output)
@@ -0,0 +1,114 @@
+#!/usr/bin/env  python3
+
+"""Benchmark of reading compressed input files
+
+Runs a challenge summing one integer per line end to end over a plain file
+and over each compressed format. Streaming decompression is compared
+against the previous workflow, decompressing to disk first and then
+running the challenge over the plain file.
+
+    prompt> python3 benchmarks/bench_compression.py [lines]
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(here, '..')))
+
+# noinspection PyPep8
+from challenges import Challenge
+# noinspection PyPep8
+from challenges.compression import open_compressed
+# noinspection PyPep8
+from challenges.lines import StreamLines
+
+
+class SumChallenge(Challenge):
+
+    def build(self):
+        self.model = sum(map(int, self.iter_lines()))
+
+    def calc(self):
+        self.result = self.model
+
+
+def run(path):
+    challenge = SumChallenge()
+    challenge.source = StreamLines(path)
+    challenge.main()
+    challenge.source.close()
+    return challenge.output
+
+
+def decompress_then_run(path, suffix, directory):
+    """The previous workflow, like gunzip followed by the challenge."""
+    plain = os.path.join(directory, 'decompressed.txt')
+    with open_compressed(path, suffix, 'rb') as pointer:
+        with open(plain, 'wb') as out:
+            shutil.copyfileobj(pointer, out, 1 << 20)
+    return run(plain)
+
+
+def measure(function, *args, repeat=3):
+    """Get the result and the best time of some runs."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return result, best
+
+
+def available(suffix):
+    if suffix != 'zst':
+        return True
+    try:
+        import zstandard
+    except ImportError:
+        return False
+    return True
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    generator = random.Random(0)
+    directory = tempfile.mkdtemp()
+    try:
+        plain = os.path.join(directory, 'data.txt')
+        with open(plain, 'w') as pointer:
+            for _ in range(count):
+                pointer.write('{}\n'.format(generator.randrange(10 ** 9)))
+        expected, seconds = measure(run, plain)
+        print('lines:  {0}, {1:.1f} MB'.format(
+            count, os.path.getsize(plain) / 1e6))
+        print('{:<8}{:>10}{:>14}{:>14}'.format(
+            'format', 'MB', 'streamed s', 'to disk s'))
+        print('{:<8}{:>10.1f}{:>14.3f}{:>14}'.format(
+            'plain', os.path.getsize(plain) / 1e6, seconds, '-'))
+        for suffix in ('gz', 'bz2', 'xz', 'zst'):
+            if not available(suffix):
+                print('{:<8}{:>10}'.format(suffix, 'missing'))
+                continue
+            path = plain + '.' + suffix
+            with open(plain) as pointer:
+                with open_compressed(path, suffix, 'w') as out:
+                    shutil.copyfileobj(pointer, out, 1 << 20)
+            streamed, seconds_streamed = measure(run, path)
+            to_disk, seconds_to_disk = measure(decompress_then_run, path,
+                                               suffix, directory)
+            assert streamed == to_disk == expected
+            print('{:<8}{:>10.1f}{:>14.3f}{:>14.3f}'.format(
+                suffix, os.path.getsize(path) / 1e6, seconds_streamed,
+                seconds_to_disk))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
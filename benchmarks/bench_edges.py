@@ -0,0 +1,64 @@
+#!/usr/bin/env  python3
+
+"""Benchmark of the slotted Edge type
+
+Compares memory and throughput of `lines_to_edges()` against the previous
+representation of an edge as `types.SimpleNamespace`.
+
+    prompt> python3 benchmarks/bench_edges.py [edges]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+import types
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(here, '..')))
+
+# noinspection PyPep8
+from challenges import Challenge
+
+
+def lines_to_namespace_edges(challenge):
+    """The previous representation, a namespace per edge."""
+    edges = []
+    for line in challenge.iter_lines():
+        for tail, head, weight in challenge._to_edge_triples(line):
+            edge = types.SimpleNamespace()
+            edge.tail = tail
+            edge.head = head
+            if weight is not None:
+                edge.weight = weight
+            edges.append(edge)
+    return edges
+
+
+def measure(function):
+    start = time.perf_counter()
+    edges = function()
+    seconds = time.perf_counter() - start
+    del edges
+    tracemalloc.start()
+    edges = function()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return len(edges) / seconds, size / len(edges)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    challenge = Challenge()
+    challenge.lines = ['{0}->{1}:{2}'.format(i, i + 1, i % 100)
+                       for i in range(count)]
+    for name, function in (
+            ('namespace', lambda: lines_to_namespace_edges(challenge)),
+            ('Edge', challenge.lines_to_edges)):
+        rate, size = measure(function)
+        print('{0:10} {1:12,.0f} edges/s {2:8.1f} bytes/edge'.format(
+            name, rate, size))
+
+
+if __name__ == '__main__':
+    main()
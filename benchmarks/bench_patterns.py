@@ -0,0 +1,53 @@
+#!/usr/bin/env  python3
+
+"""Benchmark of the compiled pattern registry
+
+Compares lines per second of `lines_to_integers()` against the previous
+implementation, that looked up the split pattern by `re.compile()` per line.
+
+    prompt> python3 benchmarks/bench_patterns.py [lines]
+"""
+
+import os
+import re
+import sys
+import time
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(here, '..')))
+
+# noinspection PyPep8
+from challenges import Challenge
+
+
+def lines_to_integers_per_line_compile(challenge):
+    """The previous implementation, compiling per line."""
+    integers = []
+    for line in challenge.lines_to_list():
+        integers.append(
+            [int(i) for i in re.compile(challenge.split_pattern).split(line)])
+    return integers
+
+
+def measure(function, count):
+    start = time.perf_counter()
+    function()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    challenge = Challenge()
+    challenge.lines = ['{0} {1}, {2} {3}'.format(i, i + 1, i + 2, i + 3)
+                       for i in range(count)]
+    before = measure(lambda: lines_to_integers_per_line_compile(challenge),
+                     count)
+    after = measure(challenge.lines_to_integers, count)
+    print('lines:  {0}'.format(count))
+    print('before: {0:,.0f} lines/s'.format(before))
+    print('after:  {0:,.0f} lines/s'.format(after))
+    print('factor: {0:.2f}'.format(after / before))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env  python3
+
+"""Benchmark of the peak memory of Challenge.read()
+
+Compares the previous read(), splitting the string of example() again,
+against the single pass of the current read(). Each variant runs in a
+fresh process, that reports the peak RSS before and after reading a
+generated sample of the given size in megabytes.
+
+    prompt> python3 benchmarks/bench_read_memory.py [megabytes]
+"""
+
+import os
+import random
+import resource
+import subprocess
+import sys
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(here, '..')))
+
+# noinspection PyPep8
+from challenges import Challenge
+
+
+def read_before(challenge):
+    """The previous implementation of Challenge.read()."""
+    lines = challenge.sample.strip().splitlines()
+    example = '\n'.join(line.strip() for line in lines)
+    challenge.lines = example.splitlines()
+
+
+def read_after(challenge):
+    challenge.read()
+
+
+def generate(megabytes):
+    """Indented lines of integers, like a sample in a class file."""
+    generator = random.Random(0)
+    chunks = []
+    size = 0
+    while size < megabytes * 1000000:
+        line = '    {} {}\n'.format(generator.randrange(10 ** 9),
+                                    generator.randrange(10 ** 9))
+        chunks.append(line)
+        size += len(line)
+    return ''.join(chunks)
+
+
+def peak_rss():
+    """Peak resident set size of this process in MB."""
+    scale = 1 if sys.platform == 'darwin' else 1024  # Bytes on macOS
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 1e6
+
+
+def measure(variant, megabytes):
+    """Run in the child process, print the peak RSS before and after."""
+    challenge = Challenge()
+    challenge.sample = generate(megabytes)
+    before = peak_rss()
+    {'before': read_before, 'after': read_after}[variant](challenge)
+    print(before, peak_rss(), len(challenge.lines))
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == '--child':
+        measure(sys.argv[2], int(sys.argv[3]))
+        return
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    print('sample: {} MB'.format(megabytes))
+    print('{:<8}{:>14}{:>14}{:>14}'.format(
+        'read', 'sample MB', 'peak MB', 'read MB'))
+    counts = set()
+    for variant in ('before', 'after'):
+        output = subprocess.run(
+            [sys.executable, __file__, '--child', variant, str(megabytes)],
+            stdout=subprocess.PIPE, universal_newlines=True,
+            check=True).stdout
+        before, after, count = output.split()
+        counts.add(count)
+        print('{:<8}{:>14.1f}{:>14.1f}{:>14.1f}'.format(
+            variant, float(before), float(after),
+            float(after) - float(before)))
+    assert len(counts) == 1
+
+
+if __name__ == '__main__':
+    main()
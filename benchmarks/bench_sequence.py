@@ -0,0 +1,63 @@
+#!/usr/bin/env  python3
+
+"""Benchmark of the sequence comparison kernels
+
+Compares the scoring of `HelloFasta` by the previous nested loop against
+`challenges.sequence.best_match()` on random reads.
+
+    prompt> python3 benchmarks/bench_sequence.py [reads] [length]
+"""
+
+import os
+import random
+import sys
+import time
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(here, '..')))
+
+# noinspection PyPep8
+from challenges.sequence import best_match
+
+
+def best_match_nested_loop(reference, records):
+    """The previous implementation of HelloFastaChallenge.calc()."""
+    winner = None
+    maximum = 0
+    for id, strand in records:
+        counter = 0
+        for position, base in enumerate(reference):
+            if strand[position] == base:
+                counter += 1
+        if counter > maximum:
+            maximum = counter
+            winner = id
+    return winner
+
+
+def measure(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    length = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    generator = random.Random(0)
+    reference = ''.join(generator.choice('ACGT') for _ in range(length))
+    records = [('Read{0}'.format(i),
+                ''.join(generator.choice('ACGT') for _ in range(length)))
+               for i in range(count)]
+    before, seconds_before = measure(best_match_nested_loop, reference,
+                                     records)
+    after, seconds_after = measure(best_match, reference, records)
+    assert before == after
+    print('reads:  {0} of length {1}'.format(count, length))
+    print('before: {0:.3f} s'.format(seconds_before))
+    print('after:  {0:.3f} s'.format(seconds_after))
+    print('factor: {0:.1f}'.format(seconds_before / seconds_after))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,35 @@
+"""Library to assist programming, testing and execution of solutions for
+coding challenges.
+
+Only the classes needed to write a challenge are imported eagerly. The
+runner and its helpers are imported lazily on first access (PEP 562), so
+that importing `Challenge` into a worker process stays cheap. The function
+`main` is bound eagerly, not to be shadowed by its submodule, and imports
+the runner when called.
+"""
+
 from challenges.challenge import Challenge
-from challenges.conf import Conf
-from challenges.scaffold import Scaffold
-from challenges.runner import Runner
+from challenges.graph import Edge
 from challenges.main import main
 
+_lazy = {
+    'Conf': 'challenges.conf',
+    'Scaffold': 'challenges.scaffold',
+    'Runner': 'challenges.runner',
+    'memoize': 'challenges.memo',
+    'trampoline': 'challenges.memo',
+}
+
+
+def __getattr__(name):
+    if name not in _lazy:
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name))
+    import importlib
+    value = getattr(importlib.import_module(_lazy[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_lazy))
@@ -0,0 +1,166 @@
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from challenges.compression import open_input
+from challenges.conf import Conf
+from challenges.guard import LimitExceeded, run_guarded
+from challenges.lines import MappedLines, StreamLines
+from challenges.output import Tee
+
+RESULT_SUFFIX = '.result.txt'
+"""Suffix of the output files written next to the inputs."""
+
+
+class Batch:
+    """Run one challenge over many input files in a pool of processes.
+
+    The challenge class is imported once per worker process. Each output is
+    written next to its input file. Outputs of earlier runs, matched by a
+    glob like inputs/*.txt, are skipped as inputs. A summary of the timings
+    per file is printed at the end.
+    """
+
+    def __init__(self, conf):
+        self.conf = conf
+
+    def run(self):
+        entry = self.conf.get_challenge_entry()
+        if entry is None or entry['module'] is None:
+            sys.exit('No challenge ' + self.conf.get_challenge_name() + '.')
+        name = (entry['module'] + '.' + self.conf.get_challenge_name()
+                + 'Challenge')
+        self.conf.get_class(name)  # Fail early, forked workers inherit it
+        try:
+            paths = get_inputs(self.conf.args.batch)
+        except ValueError as error:
+            sys.exit(str(error))
+        mode = self.get_mode()
+        start = time.perf_counter()
+        with ProcessPoolExecutor(self.conf.args.jobs, initializer=init_worker,
+                                 initargs=(self.conf.root,)) as executor:
+            results = list(executor.map(
+                run_file, [name] * len(paths), paths, [mode] * len(paths),
+                [self.conf.args.timeout] * len(paths),
+                [self.conf.args.memory_limit] * len(paths),
+                [self.conf.args.bytes] * len(paths)))
+        self.print_summary(results, time.perf_counter() - start)
+        if any(error for _, _, _, error in results):
+            sys.exit(1)
+
+    def get_mode(self):
+        if self.conf.args.mmap:
+            return 'mmap'
+        elif self.conf.args.stream:
+            return 'stream'
+        else:
+            return None
+
+    @staticmethod
+    def print_summary(results, total):
+        print('{:>10}  {}'.format('seconds', 'input'))
+        for path, output, seconds, error in results:
+            if error:
+                print('{:>10}  {}: {}'.format('FAILED', path, error))
+            else:
+                print('{:>10.4f}  {} -> {}'.format(seconds, path, output))
+        print('{:>10.4f}  total of {} files'.format(total, len(results)))
+
+
+def init_worker(root):
+    """Set up a worker process like Conf does for the main process."""
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    sys.setrecursionlimit(15000)
+
+
+def run_file(name, path, mode=None, timeout=None, memory=None,
+             bytes_mode=False):
+    """Run the challenge on one input file and write the output.
+
+    If a timeout or a memory limit is given, the challenge runs in a child
+    process guarded by them.
+
+    :param name: full qualified name of the challenge class
+    :param path: path of the input file
+    :param mode: None, 'stream' or 'mmap'
+    :param timeout: wall clock seconds or None
+    :param memory: megabytes of address space or None
+    :param bytes_mode: read bytes, even if the challenge class does not
+    :return: tuple (path, output path, seconds, error message or None)
+    """
+    output = get_output_file(path)
+    start = time.perf_counter()
+    try:
+        if timeout or memory:
+            run_guarded(lambda report: write_file(
+                name, path, output, mode, report, bytes_mode), timeout, memory)
+        else:
+            write_file(name, path, output, mode, bytes_mode=bytes_mode)
+    except Exception as error:
+        if os.path.exists(output + '.tmp'):
+            os.remove(output + '.tmp')  # Left by a stopped child
+        if isinstance(error, LimitExceeded):
+            message = str(error)
+        else:
+            message = repr(error)
+        return path, output, time.perf_counter() - start, message
+    return path, output, time.perf_counter() - start, None
+
+
+def write_file(name, path, output, mode=None, report=None, bytes_mode=False):
+    challenge = Conf.get_class(name)()
+    challenge.phase_callback = report
+    if bytes_mode:
+        challenge.bytes_mode = True
+    as_bytes = challenge.bytes_mode
+    if mode == 'mmap':
+        challenge.source = MappedLines(path, as_bytes=as_bytes)
+    elif mode == 'stream':
+        challenge.source = StreamLines(path, as_bytes=as_bytes)
+    else:
+        with open_input(path, None if as_bytes else 'utf-8') as pointer:
+            challenge.sample = pointer.read()
+    try:
+        with Tee([output]) as writer:
+            challenge.main(writer)
+    finally:
+        if challenge.source is not None:
+            challenge.source.close()  # Not read to its end by all challenges
+
+
+def get_inputs(paths):
+    """Get the input files of a batch.
+
+    Outputs of earlier runs are skipped.
+
+    :param paths: paths of the input files as given
+    :return: list of real paths
+    :raises ValueError: if two inputs would write the same output file
+    """
+    inputs = {}
+    for path in paths:
+        path = os.path.realpath(path)
+        if path.endswith(RESULT_SUFFIX):
+            continue
+        output = get_output_file(path)
+        if inputs.get(output, path) != path:
+            raise ValueError('The inputs {} and {} would both be written to '
+                             '{}.'.format(inputs[output], path, output))
+        inputs[output] = path
+    return list(inputs.values())
+
+
+def get_output_file(path):
+    """Get the path of the output file next to the input file.
+
+    Only the suffix .txt is replaced, so that inputs of the same stem, but
+    different suffixes, are written to different outputs.
+
+        inputs/data.txt -> inputs/data.result.txt
+        inputs/data.dat -> inputs/data.dat.result.txt
+    """
+    if path.endswith('.txt'):
+        path = path[:-len('.txt')]
+    return path + RESULT_SUFFIX
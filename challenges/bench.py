@@ -0,0 +1,162 @@
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+
+
+class Bench:
+    """Benchmark how a challenge scales with the size of its input.
+
+    The inputs are produced by the classmethod `generate(n)` of the
+    challenge. For each size the challenge is run once for warmup and then
+    repeatedly, each time as a new instance. The best and the mean wall time
+    are reported in a table, followed by the exponent k of the complexity
+    O(n^k), fitted by least squares on the logarithms of the best times.
+
+    The results are stored into `bench.json` of the challenge directory,
+    keyed by the git revision and the size. With `--bench-compare` they are
+    compared to the results of another revision and regressions beyond the
+    `--threshold` are flagged.
+    """
+
+    def __init__(self, conf):
+        self.conf = conf
+
+    def bench(self):
+        klass = self.conf.get_class(
+            self.conf.get_full_qualified_challenge_name())
+        sizes = sorted(self.conf.args.sizes)
+        repeat = max(self.conf.args.repeat, 1)
+        results = []
+        print('{:>12}{:>14}{:>14}'.format('size', 'best s', 'mean s'))
+        for size in sizes:
+            try:
+                sample = klass.generate(size)
+            except NotImplementedError:
+                sys.exit('The challenge has no generate(n) classmethod.')
+            self.measure(klass, sample)  # Warmup
+            times = [self.measure(klass, sample) for _ in range(repeat)]
+            results.append((size, min(times), sum(times) / len(times)))
+            print('{:>12}{:>14.6f}{:>14.6f}'.format(*results[-1]))
+        exponent = self.fit_exponent([(size, best)
+                                      for size, best, _ in results])
+        if exponent is not None:
+            print('--- Complexity: O(n^{:.2f}) ---'.format(exponent))
+        revision = self.get_revision()
+        store = self.load_store()
+        self.add_to_store(store, revision, results, repeat)
+        self.write_store(store)
+        if self.conf.args.bench_compare is not None:
+            if self.compare(store, revision, results):
+                sys.exit(1)
+        return results
+
+    def compare(self, store, revision, results):
+        """Compare the results to the results of a base revision.
+
+        The base revision is given by `--bench-compare`, else it is the
+        latest stored revision other than the current one.
+
+        :return: True if there is a regression beyond the threshold
+        """
+        base = self.conf.args.bench_compare
+        if not base:
+            others = [(entry['time'], name) for name, entry in store.items()
+                      if name != revision]
+            if not others:
+                print('--- No other revision to compare with ---')
+                return False
+            base = max(others)[1]
+        if base not in store:
+            sys.exit('No results stored for revision {}.'.format(base))
+        threshold = self.conf.args.threshold
+        print('--- Compare {} with {} ---'.format(revision, base))
+        print('{:>12}{:>14}{:>14}{:>10}'.format(
+            'size', 'base s', 'best s', 'change'))
+        regression = False
+        for size, best, _ in results:
+            entry = store[base]['sizes'].get(str(size))
+            if entry is None:
+                print('{:>12}{:>14}{:>14.6f}{:>10}'.format(size, '-', best,
+                                                           '-'))
+                continue
+            change = best / entry['best'] - 1
+            flag = ''
+            if change > threshold:
+                flag = '  REGRESSION'
+                regression = True
+            print('{:>12}{:>14.6f}{:>14.6f}{:>+9.1f}%{}'.format(
+                size, entry['best'], best, change * 100, flag))
+        return regression
+
+    def get_revision(self):
+        """Get the git revision of the challenge directory.
+
+        A revision with uncommitted changes to tracked files is marked by a
+        trailing `+`.
+
+        :return: short hash or 'unknown' outside of git
+        """
+        directory = self.conf.get_challenge_dir()
+        try:
+            revision = subprocess.check_output(
+                ['git', 'rev-parse', '--short', 'HEAD'], cwd=directory,
+                stderr=subprocess.DEVNULL).decode().strip()
+            status = subprocess.check_output(
+                ['git', 'status', '--porcelain', '--untracked-files=no',
+                 '.'], cwd=directory,
+                stderr=subprocess.DEVNULL)
+        except (OSError, subprocess.CalledProcessError):
+            return 'unknown'
+        return revision + '+' if status.strip() else revision
+
+    def load_store(self):
+        path = self.conf.get_bench_file()
+        if not os.path.exists(path):
+            return {}
+        with open(path) as pointer:
+            return json.load(pointer)
+
+    def write_store(self, store):
+        with open(self.conf.get_bench_file(), 'w') as pointer:
+            json.dump(store, pointer, indent=4, sort_keys=True)
+
+    @staticmethod
+    def add_to_store(store, revision, results, repeat):
+        """Add the results to the store, replacing those of equal size."""
+        entry = store.setdefault(revision, {'sizes': {}})
+        entry['time'] = time.time()
+        for size, best, mean in results:
+            entry['sizes'][str(size)] = {'best': best, 'mean': mean,
+                                         'repeat': repeat}
+
+    @staticmethod
+    def measure(klass, sample):
+        """Run a new instance of the challenge on the sample.
+
+        :return: wall time of main() in seconds
+        """
+        challenge = klass()
+        challenge.sample = sample
+        start = time.perf_counter()
+        challenge.main()
+        return time.perf_counter() - start
+
+    @staticmethod
+    def fit_exponent(points):
+        """Fit the exponent k of t = c * n^k by least squares in log space.
+
+        :param points: list of tuples (size, seconds)
+        :return: exponent or None if less than two distinct sizes
+        """
+        points = [(math.log(size), math.log(seconds))
+                  for size, seconds in points if size > 0 and seconds > 0]
+        if len({x for x, _ in points}) < 2:
+            return None
+        mean_x = sum(x for x, _ in points) / len(points)
+        mean_y = sum(y for _, y in points) / len(points)
+        covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+        variance = sum((x - mean_x) ** 2 for x, _ in points)
+        return covariance / variance
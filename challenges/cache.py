@@ -0,0 +1,112 @@
+import hashlib
+import os
+
+
+class ResultCache:
+    """Content addressed on-disk store of challenge outputs.
+
+    The key of an output is the hash of the library version, the source of
+    the challenge module and the input, see key(). As long as none of them
+    changes, a run of the challenge is answered from the store.
+
+    The store is bounded by size. Reading an output touches its file, and
+    the least recently used outputs are evicted first.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    chunk_size = 1 << 20
+    """Characters of a sample encoded at a time while hashing."""
+
+    @classmethod
+    def key(cls, version: str, module_file: str, sample=None,
+            input_file: str = None, bytes_mode: bool = False):
+        """Hash the version, the module source and the input.
+
+        A sample is hashed by its content, chunk by chunk, so that no
+        encoded copy of the whole input is made. An input file, that is
+        read lazily by --stream or --mmap, is keyed by its path, size and
+        modification time instead. Hashing its content would read every
+        byte before the first line is used. An edit that keeps the size
+        and the modification time goes unnoticed.
+
+        :param version: version of the library
+        :param module_file: path of the challenge module
+        :param sample: input as string or bytes, if not given as file
+        :param input_file: path of the input file
+        :param bytes_mode: if the challenge reads bytes, that changes output
+        :return: hex digest
+        """
+        digest = hashlib.sha256(version.encode('utf-8') + b'\0')
+        if bytes_mode:
+            digest.update(b'bytes\0')
+        with open(module_file, 'rb') as pointer:
+            digest.update(pointer.read())
+        digest.update(b'\0')
+        if input_file is not None:
+            status = os.stat(input_file)
+            digest.update('file\0{}\0{}\0{}'.format(
+                os.path.realpath(input_file), status.st_size,
+                status.st_mtime_ns).encode('utf-8', 'surrogateescape'))
+        elif isinstance(sample, bytes):
+            digest.update(sample)
+        else:
+            for start in range(0, len(sample), cls.chunk_size):
+                digest.update(
+                    sample[start:start + cls.chunk_size].encode('utf-8'))
+        return digest.hexdigest()
+
+    def path(self, key: str):
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key: str):
+        """Get a stored output and mark it as recently used.
+
+        :return: output or None if not stored
+        """
+        path = self.path(key)
+        try:
+            with open(path, encoding='utf-8') as pointer:
+                output = pointer.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return output
+
+    def prepare(self, key: str):
+        """Create the directory of a key to write its output.
+
+        Call evict() after writing the output to the returned path.
+
+        :return: path of the output
+        """
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return path
+
+    def put(self, key: str, output: str):
+        """Store an output and evict the least recently used ones."""
+        path = self.prepare(key)
+        temporary = path + '.tmp'
+        with open(temporary, 'w', encoding='utf-8') as pointer:
+            pointer.write(output)
+        os.replace(temporary, path)
+        self.evict()
+
+    def evict(self):
+        """Remove the least recently used outputs beyond the size limit."""
+        files = []
+        total = 0
+        for directory, _, names in os.walk(self.directory):
+            for name in names:
+                path = os.path.join(directory, name)
+                status = os.stat(path)
+                files.append((status.st_mtime, status.st_size, path))
+                total += status.st_size
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
@@ -3,11 +3,33 @@
 This module holds the base class of all challenges.
 """
 
+import io
 import re
 import math
+import time
 import types
+from array import array
+from itertools import islice
 from collections import defaultdict
 
+from challenges.compression import detect
+from challenges.fasta import FastaIndex, open_fasta, parse_fasta
+from challenges.graph import CsrGraph, Edge
+from challenges.lines import normalise
+
+PARENTHESIS = re.compile(r'^\((.*)\)$')
+"""Matches a line surrounded by a pair of round parenthesis."""
+
+PARENTHESIS_GROUPS = re.compile(r'\(([^)]*)\)')
+"""Finds the contents of all groups of round parenthesis in a line."""
+
+PARENTHESIS_BYTES = re.compile(PARENTHESIS.pattern.encode('ascii'))
+"""Like PARENTHESIS for lines of bytes."""
+
+PARENTHESIS_GROUPS_BYTES = re.compile(
+    PARENTHESIS_GROUPS.pattern.encode('ascii'))
+"""Like PARENTHESIS_GROUPS for lines of bytes."""
+
 
 class Challenge:
     """Base class of all challenges
@@ -56,6 +78,14 @@ class Challenge:
 
         prompt> challenge MyChallenge --file ~/Downloads/data.txt
 
+    Source:
+
+    For large input files the runner can inject a line source into the
+    attribute `source` instead of the files content. The method `read` then
+    uses it in place of the list of lines built from `sample`::
+
+        prompt> challenge MyChallenge --file ~/Downloads/data.txt --stream
+
     """
 
     sample = '''
@@ -119,10 +149,75 @@ class Challenge:
     Matches lines holding FASTA sequences.
     """
 
+    phases = ('read', 'build', 'calc', 'format')
+    """The worker methods called by main() in order."""
+
+    pattern_names = ('split_pattern', 'edge_pattern', 'multi_edge_pattern',
+                     'fasta_pattern')
+    """Names of the class attributes holding reg expressions.
+
+    They are compiled once per class into the registry `_patterns`, when the
+    class is defined. See `compiled_pattern()`.
+    """
+
+    _patterns = {}
+    """Registry of the compiled patterns of the class, keyed by name."""
+
+    _bytes_patterns = {}
+    """Registry of the patterns compiled for bytes, keyed by name.
+
+    Filled on first use in bytes mode, as not every str pattern is valid for
+    bytes, i.e. one using \\N{...} escapes.
+    """
+
+    bytes_mode = False
+    """If True, self.lines holds bytes instead of str.
+
+    For ASCII datasets, like DNA or integers, decoding the input is skipped
+    entirely. The parsing helpers use the patterns compiled for bytes then.
+    Words and FASTA ids are bytes, too. Numbers are parsed as usual. Set by
+    the challenge class or by the runner option --bytes.
+    """
+
+    @classmethod
+    def generate(cls, n: int):
+        """Generate an input of size n for benchmarks.
+
+        Optionally implemented by the inheriting class to support the
+        option `--bench` of the runner. The meaning of n is up to the
+        challenge, i.e. the number of lines or the length of a word.
+
+        :param n: size of the input
+        :return: input string like sample
+        """
+        raise NotImplementedError
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._compile_patterns()
+
+    @classmethod
+    def _compile_patterns(cls):
+        """Compile the patterns of the class into the registry.
+
+        The registry of bytes patterns is reset and filled on demand.
+        """
+        cls._patterns = {name: re.compile(getattr(cls, name))
+                         for name in cls.pattern_names}
+        cls._bytes_patterns = {}
+
     def __init__(self):
         self.lines = []
         """A list of lines that will be filled by the method read()."""
 
+        self.source = None
+        """An optional line source injected by the runner.
+
+        A sequence of normalised lines, i.e. `challenges.lines.StreamLines` or
+        `challenges.lines.MappedLines`.
+        If given, the method read() uses it in place of the sample.
+        """
+
         self.model = types.SimpleNamespace()
         """The imported data model.
 
@@ -143,7 +238,42 @@ class Challenge:
         grader.
         """
 
-    def main(self):
+        self.phase = None
+        """The name of the phase currently run by main(), else None."""
+
+        self.phase_callback = None
+        """Callable called with the name of each phase as it starts.
+
+        I.e. to report the active phase to a parent process, that guards
+        the challenge by a timeout.
+        """
+
+        self.timings = {}
+        """Timings of the phases run by main().
+
+        A dict with the names of the phases as keys. The values are
+        namespaces with the attributes `wall` and `cpu` in seconds and `peak`,
+        the peak of the traced memory in bytes or None if not traced.
+        """
+
+        self.trace_memory = False
+        """If True, main() traces the peak memory of each phase.
+
+        Tracing by tracemalloc slows down the challenge considerably.
+        """
+
+        self.profiler = None
+        """An optional profiler injected by the runner, i.e. cProfile.Profile.
+
+        It is enabled during the phases listed in self.profile_phases.
+        """
+
+        self.profile_phases = ('calc',)
+        """The phases to profile, if a profiler is injected."""
+
+        self._fasta_index = None
+
+    def main(self, writer=None):
         """Control the workflow of the challenge.
 
         Usually this method doesn't need to be overwritten.
@@ -151,11 +281,69 @@ class Challenge:
         The workers share data via instance variables.
         The overall input is injected into self.sample.
         The overall output is read from self.result.
+
+        Each worker is run as a phase by run_phase(), that records its
+        timings into self.timings.
+
+        If a writer is given, the phase format is run by format_stream(),
+        that writes the output into the writer instead of self.output.
+
+        :param writer: object with a method write(), i.e. an open file
         """
-        self.read()
-        self.build()
-        self.calc()
-        self.format()
+        self.timings = {}
+        started = False
+        if self.trace_memory:
+            import tracemalloc
+            started = not tracemalloc.is_tracing()
+            if started:
+                tracemalloc.start()
+        try:
+            for name in self.phases:
+                if name == 'format' and writer is not None:
+                    self.run_phase(name, lambda: self.format_stream(writer))
+                else:
+                    self.run_phase(name)
+        finally:
+            if started:
+                tracemalloc.stop()
+
+    def run_phase(self, name: str, worker=None):
+        """Run one worker method and record its timings.
+
+        Wall and CPU time are always recorded. The peak memory is recorded
+        if self.trace_memory is set and tracemalloc is tracing, as started by
+        main(). The worker is profiled if a profiler is injected and the phase
+        is listed in self.profile_phases.
+
+        :param name: name of the worker method
+        :param worker: callable to run instead of the method, i.e. to pass
+            arguments
+        """
+        self.phase = name
+        if self.phase_callback is not None:
+            self.phase_callback(name)
+        tracemalloc = None
+        if self.trace_memory:
+            import tracemalloc
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc = None
+        profile = (self.profiler is not None
+                   and name in self.profile_phases)
+        wall, cpu = time.perf_counter(), time.process_time()
+        if profile:
+            self.profiler.enable()
+        try:
+            (worker or getattr(self, name))()
+        finally:
+            if profile:
+                self.profiler.disable()
+        self.timings[name] = types.SimpleNamespace(
+            wall=time.perf_counter() - wall,
+            cpu=time.process_time() - cpu,
+            peak=tracemalloc.get_traced_memory()[1] if tracemalloc else None)
+        self.phase = None
 
     # --------------------------------------------------
     # Default and abstract workers
@@ -164,9 +352,23 @@ class Challenge:
     def read(self):
         """Extract the input string self.sample into self.lines.
 
+        If a line source is injected into self.source it is used as
+        self.lines instead.
+
+        The sample is split into normalised lines in one pass, see
+        challenges.lines.normalise(). If example() is reimplemented, its
+        result is split instead.
+
         Typically this method can be used as is.
         """
-        self.lines = self.example().splitlines()
+        if self.source is not None:
+            self.lines = self.source
+        elif type(self).example is not Challenge.example:
+            self.lines = self.example().splitlines()
+        elif self.bytes_mode and isinstance(self.sample, str):
+            self.lines = normalise(self.sample.encode('utf-8'))
+        else:
+            self.lines = normalise(self.sample)
 
     def build(self):
         """Set up the model from the input lines.
@@ -197,8 +399,31 @@ class Challenge:
 
         Reads from self.result.
         Fills self.output.
+
+        If only format_stream() is reimplemented, its chunks are collected
+        into self.output.
+        """
+        if type(self).format_stream is not Challenge.format_stream:
+            buffer = io.StringIO()
+            self.format_stream(buffer)
+            self.output = buffer.getvalue()
+        else:
+            self.output = str(self.result)
+
+    def format_stream(self, writer):
+        """Write the output in chunks into the writer.
+
+        Reimplement this method for huge outputs, that should not be built
+        as one string. The runner passes a writer, that tees the chunks to
+        stdout and the output files in one pass. By default the output
+        of format() is written as one chunk.
+
+        Reads from self.result.
+
+        :param writer: object with a method write(), i.e. an open file
         """
-        self.output = str(self.result)
+        self.format()
+        writer.write(self.output)
 
     # --------------------------------------------------
     # Accessing example and expectation
@@ -206,23 +431,54 @@ class Challenge:
 
     def example(self):
         """Get the sample, with heading whitespace trimmed"""
-        lines = self.sample.strip().splitlines()
-        return '\n'.join(line.strip() for line in lines)
+        return '\n'.join(normalise(self.sample))
 
     def expectation(self):
         """Get the expecation, with heading whitespace trimmed"""
-        lines = self.expect.strip().splitlines()
-        return '\n'.join(line.strip() for line in lines)
+        return '\n'.join(normalise(self.expect))
 
     # --------------------------------------------------
     # Accessing input lines
     # --------------------------------------------------
 
+    def compiled_pattern(self, name: str, as_bytes: bool = None):
+        """Return the compiled reg expression of a pattern attribute.
+
+        The compiled pattern is taken from the registry of the class. If the
+        attribute was changed later on, on the class or on the instance, it is
+        compiled again and registered for the instance. Patterns for bytes are
+        compiled and registered for the class on first use. They must be
+        ASCII, as a class of a non-ASCII character would change its meaning.
+
+        :param name: name of the pattern attribute, i.e. 'split_pattern'
+        :param as_bytes: compiled for bytes, defaults to self.bytes_mode
+        :return: compiled reg expression
+        :raises UnicodeEncodeError: if a bytes pattern is not ASCII
+        """
+        if as_bytes is None:
+            as_bytes = self.bytes_mode
+        registry = '_bytes_patterns' if as_bytes else '_patterns'
+        patterns = getattr(self, registry)
+        compiled = patterns.get(name)
+        pattern = getattr(self, name)
+        if as_bytes:
+            pattern = pattern.encode('ascii')  # Else a class changes meaning
+        if compiled is None or compiled.pattern != pattern:
+            compiled = re.compile(pattern)
+            if name not in patterns and \
+                    getattr(self, name) == getattr(type(self), name):
+                patterns[name] = compiled  # First use of the class pattern
+            else:
+                patterns = dict(patterns)
+                patterns[name] = compiled
+                setattr(self, registry, patterns)
+        return compiled
+
     def line(self, nr: int):
         """ Return one line by the given number.
 
         :param nr: line number
-        :return: line as string
+        :return: line as string, as bytes in bytes mode
         """
         return self.lines[nr]
 
@@ -240,6 +496,22 @@ class Challenge:
         else:
             return self.lines[start:]
 
+    def iter_lines(self, start: int = 0, stop: int = None):
+        """Return an iterator over a range of lines.
+
+        Like lines_to_list(), but without building a list. Lazy line sources
+        are consumed as the iterator advances. Negative indices count from
+        the end, like slices do, so a lazy source is read to its end.
+
+        :param start: index of first line
+        :param stop: index of line after last line
+        :return: iterator of lines
+        """
+        if (isinstance(self.lines, list) or start < 0
+                or (stop is not None and stop < 0)):
+            return iter(self.lines[start:stop or None])
+        return islice(self.lines, start, stop or None)
+
     def _to_words(self, line: str):
         """ Split line into words
 
@@ -248,7 +520,7 @@ class Challenge:
         :param line: the string to split
         :return: list of words
         """
-        return list(re.compile(self.split_pattern).split(line))
+        return self.compiled_pattern('split_pattern').split(line)
 
     def line_to_words(self, nr: int):
         """ Split one line into a list of words.
@@ -271,12 +543,13 @@ class Challenge:
         :return: one or two dimensional list of words
         :see: self._to_words()
         """
+        split = self.compiled_pattern('split_pattern').split
         words = []
-        for line in self.lines_to_list(start, stop):
+        for line in self.iter_lines(start, stop):
             if flatten:
-                words += self._to_words(line)
+                words += split(line)
             else:
-                words.append(self._to_words(line))
+                words.append(split(line))
         return words
 
     def _to_integers(self, line:str):
@@ -287,7 +560,8 @@ class Challenge:
         :param line: the string to split
         :return: list of integers
         """
-        return [int(i) for i in re.compile(self.split_pattern).split(line)]
+        return [int(i) for i in
+                self.compiled_pattern('split_pattern').split(line)]
 
     def line_to_integer(self, nr: int):
         """ Return line as integer.
@@ -317,12 +591,13 @@ class Challenge:
         :return: one or two dimensional list of integers
         :see: self._to_integers()
         """
+        split = self.compiled_pattern('split_pattern').split
         integers = []
-        for line in self.lines_to_list(start, stop):
+        for line in self.iter_lines(start, stop):
             if flatten:
-                integers += self._to_integers(line)
+                integers += map(int, split(line))
             else:
-                integers.append(self._to_integers(line))
+                integers.append([int(i) for i in split(line)])
         return integers
 
     def _to_floats(self, line:str):
@@ -333,7 +608,8 @@ class Challenge:
         :param line: the string to split
         :return: list of floats
         """
-        return [float(f) for f in re.compile(self.split_pattern).split(line)]
+        return [float(f) for f in
+                self.compiled_pattern('split_pattern').split(line)]
 
     def line_to_float(self, nr: int):
         """ Return line as float.
@@ -363,14 +639,66 @@ class Challenge:
         :return: one or two dimensional list of floats
         :see: self._to_floats()
         """
+        split = self.compiled_pattern('split_pattern').split
         floats = []
-        for line in self.lines_to_list(start, stop):
+        for line in self.iter_lines(start, stop):
             if flatten:
-                floats += self._to_floats(line)
+                floats += map(float, split(line))
             else:
-                floats.append(self._to_floats(line))
+                floats.append([float(f) for f in split(line)])
         return floats
 
+    def lines_to_array(self, start: int = 0, stop: int = None,
+                       dtype=float, flatten: bool = False):
+        """Parse a range of lines into a NumPy array in bulk.
+
+        Returns a two dimensional array with one row per line, or a one
+        dimensional array if flatten is True. With the default split_pattern
+        the text is handed to `numpy.loadtxt` as a whole, else the rows are
+        split by the pattern and converted by NumPy at once.
+
+        NumPy is an optional dependency. If it isn't installed or the rows
+        are ragged or empty, this falls back to lines_to_integers() or
+        lines_to_floats(), depending on dtype, and returns lists.
+
+        If stop is not given all remaining lines are used.
+
+        :param start: index of first line
+        :param stop: index of line after last line
+        :param dtype: type of the elements, i.e. int, float or 'int64'
+        :param flatten: flatten to one dimensional array
+        :return: one or two dimensional array or list
+        """
+        lines = list(self.iter_lines(start, stop))
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        if numpy is not None and lines:
+            try:
+                if self.split_pattern == Challenge.split_pattern and \
+                        isinstance(lines[0], bytes):
+                    text = b'\n'.join(lines).replace(b',', b' ')
+                    values = numpy.loadtxt(io.BytesIO(text), dtype=dtype,
+                                           ndmin=2, comments=None)
+                elif self.split_pattern == Challenge.split_pattern:
+                    text = '\n'.join(lines).replace(',', ' ')
+                    values = numpy.loadtxt(io.StringIO(text), dtype=dtype,
+                                           ndmin=2, comments=None)
+                else:
+                    split = self.compiled_pattern('split_pattern').split
+                    values = numpy.array([split(line) for line in lines])
+                    values = values.astype(dtype)
+            except ValueError:
+                pass  # Ragged rows, fall back to lists
+            else:
+                if len(values) == len(lines):  # No empty lines skipped
+                    return values.ravel() if flatten else values
+        if _is_integer_type(dtype):
+            return self.lines_to_integers(start, stop, flatten)
+        else:
+            return self.lines_to_floats(start, stop, flatten)
+
     def line_to_permutation(self, nr: int, terminals: bool = False):
         """Convert one line to a permutation
 
@@ -388,12 +716,16 @@ class Challenge:
         :return: permutation
         """
         line = self.line(nr)
-        match = re.compile('^\((.*)\)$').match(line)
+        if isinstance(line, bytes):
+            match = PARENTHESIS_BYTES.match(line)
+        else:
+            match = PARENTHESIS.match(line)
         if match:
             digits = match.group(1)
         else:
             digits = line
-        perm = [int(d) for d in re.compile(self.split_pattern).split(digits)]
+        perm = [int(d) for d in
+                self.compiled_pattern('split_pattern').split(digits)]
         if terminals:
             perm = [0] + perm + [len(perm) + 1]
         return tuple(perm)
@@ -409,11 +741,15 @@ class Challenge:
         :param nr: line number
         :return: list of permutations (tuples)
         """
-        matches = re.findall('\(([^)]*)\)', self.line(nr))
+        split = self.compiled_pattern('split_pattern').split
+        line = self.line(nr)
+        if isinstance(line, bytes):
+            matches = PARENTHESIS_GROUPS_BYTES.findall(line)
+        else:
+            matches = PARENTHESIS_GROUPS.findall(line)
         result = []
         for digits in matches:
-            result.append(tuple(int(d) for d in re.compile(
-                self.split_pattern).split(digits)))
+            result.append(tuple(int(d) for d in split(digits)))
         return result
 
     # noinspection PyMethodMayBeStatic
@@ -431,43 +767,45 @@ class Challenge:
 
             tail->head, head, head
 
-        Edge is of type namespace:
+        Edge is of type challenges.graph.Edge:
 
             edge.tail
             edge.head
-            edge.weight if given
+            edge.weight, None if not given
 
         :param line: input string
         :return: list of edge
+        :see: self._to_edge_triples
         """
-        edges = []
-        match = re.compile(self.edge_pattern).match(line)
+        return [Edge(tail, head, weight)
+                for tail, head, weight in self._to_edge_triples(line)]
+
+    def _to_edge_triples(self, line: str):
+        """Convert input string to edges as plain tuples.
+
+        Like self._to_edges(), but without creating an object per edge.
+
+        :param line: input string
+        :return: list of tuples (tail, head, weight), weight may be None
+        """
+        match = self.compiled_pattern('edge_pattern').match(line)
         if match:
-            edge = types.SimpleNamespace()
-            edge.tail = int(match.group(1))
-            edge.head = int(match.group(2))
-            if match.group(4):
-                edge.weight = int(match.group(4))
-            edges.append(edge)
-        else:
-            match = re.compile(self.multi_edge_pattern).match(line)
-            if match:
-                tail = int(match.group(1))
-                rest = match.group(2)
-                heads = [int(i) for i in
-                         re.compile(self.split_pattern).split(rest)]
-                for head in heads:
-                    edge = types.SimpleNamespace()
-                    edge.tail = tail
-                    edge.head = head
-                    edges.append(edge)
-        return edges
+            weight = match.group(4)
+            return [(int(match.group(1)), int(match.group(2)),
+                     int(weight) if weight else None)]
+        match = self.compiled_pattern('multi_edge_pattern').match(line)
+        if match:
+            tail = int(match.group(1))
+            split = self.compiled_pattern('split_pattern').split
+            return [(tail, int(head), None)
+                    for head in split(match.group(2))]
+        return []
 
     def line_to_edge(self, nr: int):
         """Convert one line to an edge.
 
         :param nr: line number
-        :return: edge (namespace: tail, head, weight)
+        :return: edge (Edge: tail, head, weight)
         :see: self._to_edges
         """
         return self._to_edges(self.line(nr))[0]
@@ -478,7 +816,7 @@ class Challenge:
         1->2,3,4
 
         :param nr: line number
-        :return: edge (namespace: tail, head, weight)
+        :return: list of edges (Edge: tail, head, weight)
         :see: self._to_edges
         """
         return self._to_edges(self.line(nr))
@@ -494,11 +832,11 @@ class Challenge:
 
         :param start:
         :param stop:
-        :return: list of edges (namespace: tail, head, weight)
+        :return: list of edges (Edge: tail, head, weight)
         :see: self._to_edges
         """
         edges = []
-        for line in self.lines_to_list(start, stop):
+        for line in self.iter_lines(start, stop):
                 edges += self._to_edges(line)
         return edges
 
@@ -524,28 +862,64 @@ class Challenge:
         :param start:
         :param stop:
         :return: graph, namespace with graphs properties
-        :see: self._to_edges
+        :see: self._to_edge_triples
         """
         graph = types.SimpleNamespace()
         graph.edges = defaultdict(list)
         graph.weights = dict()
-        edges = []
-        nodes = []
-        for line in self.lines_to_list(start, stop):
-            edges += self._to_edges(line)
-        for edge in edges:
-            nodes.append(edge.head)
-            nodes.append(edge.tail)
-            graph.edges[edge.tail].append(edge.head)
-            try:
-                graph.weights[(edge.tail, edge.head)] = edge.weight
-            except AttributeError:
-                pass
-        graph.nodes = sorted(set(nodes))
-        graph.edge_count = len(edges)
+        edge_count = 0
+        nodes = set()
+        for line in self.iter_lines(start, stop):
+            for tail, head, weight in self._to_edge_triples(line):
+                nodes.add(head)
+                nodes.add(tail)
+                graph.edges[tail].append(head)
+                if weight is not None:
+                    graph.weights[(tail, head)] = weight
+                edge_count += 1
+        graph.nodes = sorted(nodes)
+        graph.edge_count = edge_count
         graph.node_count = len(graph.nodes)
         return graph
 
+    def lines_to_csr_graph(self, start: int = 0, stop: int = None):
+        """Return a compact graph in CSR format for a range of lines
+
+        Takes the same formats as lines_to_graph(). Other than that, no object
+        is created per edge. The edges are stored in arrays in compressed
+        sparse row format, which scales to graphs of many millions of edges.
+
+        If stop is not given all remaining lines are used.
+
+        Properties:
+
+            graph.nodes:
+                array of node ids, sorted
+
+            graph.index:
+                dict, node ids as keys and positions as values
+
+            graph.offsets, graph.heads, graph.weights:
+                arrays of the edges grouped by the positions of the tails
+
+        :param start:
+        :param stop:
+        :return: graph, challenges.graph.CsrGraph
+        :see: self._to_edge_triples
+        """
+        tails, heads, weights = array('q'), array('q'), array('q')
+        weighted = False
+        for line in self.iter_lines(start, stop):
+            for tail, head, weight in self._to_edge_triples(line):
+                tails.append(tail)
+                heads.append(head)
+                if weight is None:
+                    weights.append(0)
+                else:
+                    weights.append(weight)
+                    weighted = True
+        return CsrGraph(tails, heads, weights if weighted else None)
+
     def edges(self, start: int = 0, stop: int = None):
         """Generator to read edges from lines.
 
@@ -562,13 +936,11 @@ class Challenge:
         The match behaviour can be adjusted by the self.edge_pattern.
         """
         def _to_edge(match):
-            edge = types.SimpleNamespace()
-            edge.tail = int(match.group(1))
-            edge.head = int(match.group(2))
-            if match.group(4):
-                edge.weight = int(match.group(4))
-            return edge
+            weight = match.group(4)
+            return Edge(int(match.group(1)), int(match.group(2)),
+                        int(weight) if weight else None)
 
+        edge_match = self.compiled_pattern('edge_pattern').match
         if stop is None:
             stop = math.inf
         nr = start
@@ -577,14 +949,15 @@ class Challenge:
                 line = self.line(nr)
             except IndexError:
                 break
-            match = re.compile(self.edge_pattern).match(line)
+            match = edge_match(line)
             if match:
                 yield (_to_edge(match))
                 nr += 1
             else:
                 break  # If edges end before stop, which may be infinity
 
-    def fasta(self, start: int = 0, stop: int = None):
+    def fasta(self, start: int = 0, stop: int = None,
+              as_bytes: bool = None):
         """Generator to read FASTA formatted samples.
 
         Reads multiple fasta sequences and yields them.
@@ -596,37 +969,113 @@ class Challenge:
         The line to stop is set by the parameter stop. When it is not provided
         lines are used as long as they match the FASTA format.
         The match behaviour can be adjusted by the self.fasta_pattern.
+
+        In bytes mode the ids are bytes, too.
+
+        :param start: index of first line
+        :param stop: index of line after last line
+        :param as_bytes: yield sequences as bytes, defaults to self.bytes_mode
+        :see: challenges.fasta.parse_fasta()
         """
-        name, sequence = '', ''
-        if stop is None:
-            stop = math.inf
-        nr = start
-        while nr < stop:
-            try:
-                line = self.line(nr)
-            except IndexError:
-                break
-            if line.startswith('>'):
-                if name != '' and sequence != '':
-                    # Yield previous sequence if any
-                    yield name, sequence
-                name, sequence = line[1:], ''  # Reset
+        if as_bytes is None:
+            as_bytes = self.bytes_mode
+        yield from parse_fasta(self.iter_lines(start, stop),
+                               self.compiled_pattern('fasta_pattern'),
+                               as_bytes, self.bytes_mode)
+
+    def fasta_file(self, path: str = None, as_bytes: bool = None):
+        """Generator to read FASTA records directly from a file.
+
+        The file is memory mapped and parsed without going through
+        self.lines. If no path is given, the path of the injected source is
+        used.
+
+        A compressed source can not be memory mapped. Its lines are parsed
+        instead, like those of a source without a file. Empty lines are
+        skipped then, as they are when reading the file. In bytes mode the
+        ids are bytes, too.
+
+        :param path: path of the FASTA file
+        :param as_bytes: yield sequences as bytes, defaults to self.bytes_mode
+        :raises ValueError: if no file is given or the file is compressed
+        :see: challenges.fasta.open_fasta()
+        """
+        if as_bytes is None:
+            as_bytes = self.bytes_mode
+        path = self._fasta_path(path)
+        if path is None and self.source is not None:
+            yield from parse_fasta((line for line in self.source if line),
+                                   self.compiled_pattern('fasta_pattern'),
+                                   as_bytes, self.bytes_mode)
+            return
+        if path is None:
+            raise ValueError('No FASTA file given.')
+        yield from open_fasta(path, self.compiled_pattern('fasta_pattern'),
+                              as_bytes, self.bytes_mode)
+
+    def fasta_record(self, name, path: str = None, as_bytes: bool = None):
+        """Get the sequence of one FASTA record by its id.
+
+        The record is fetched from the file by a FastaIndex, that is stored
+        as sidecar file next to it and reused by later runs. If no path is
+        given, the path of the injected source is used. Without any file the
+        lines are searched by self.fasta(), the lines of a compressed source
+        by self.fasta_file().
+
+        :param name: id of the record, str or bytes
+        :param path: path of the FASTA file
+        :param as_bytes: return the sequence as bytes, defaults to
+            self.bytes_mode
+        :return: sequence
+        :raises KeyError: if there is no record of the id
+        :raises ValueError: if the given file is compressed
+        :see: challenges.fasta.FastaIndex
+        """
+        if as_bytes is None:
+            as_bytes = self.bytes_mode
+        path = self._fasta_path(path)
+        if path is None:
+            if isinstance(name, str) and self.bytes_mode:
+                name = name.encode('utf-8')
+            elif isinstance(name, bytes) and not self.bytes_mode:
+                name = name.decode('utf-8')
+            if self.source is None:
+                records = self.fasta(as_bytes=as_bytes)
             else:
-                match = re.compile(self.fasta_pattern).match(line)
-                if match:
-                    sequence += line
-                else:
-                    break  # If edges end before stop, which may be infinity
-            nr += 1
-        # Yield final sequence
-        yield name, sequence
-
-    def fasta_strands(self, start: int = 0, stop: int = None):
+                records = self.fasta_file(as_bytes=as_bytes)
+            for record, sequence in records:
+                if record == name:
+                    return sequence
+            raise KeyError(name)
+        if isinstance(name, bytes):
+            name = name.decode('utf-8')
+        if self._fasta_index is None or self._fasta_index.path != path:
+            self._fasta_index = FastaIndex.load(path)
+        return self._fasta_index.fetch(name, as_bytes)
+
+    def _fasta_path(self, path: str = None):
+        """Get the FASTA file to read directly, if any.
+
+        :param path: path of the FASTA file or None for the injected source
+        :return: path or None, if there is no source or it is compressed
+        :raises ValueError: if the given file is compressed
+        """
+        if path is None:
+            path = getattr(self.source, 'path', None)
+            if path is not None and detect(path) is not None:
+                return None  # Fall back to the lines of the source
+        elif detect(path) is not None:
+            raise ValueError('Can not read the compressed FASTA file {} '
+                             'directly, decompress it first.'.format(path))
+        return path
+
+    def fasta_strands(self, start: int = 0, stop: int = None,
+                      as_bytes: bool = None):
         """ Get the strands of a fasta read as list.
 
         Takes the same arguments as self.fasta() and delegates to it.
         """
-        return list(dict(self.fasta(start, stop)).values())
+        return list(dict(self.fasta(start, stop, as_bytes)).values())
 
     # --------------------------------------------------
     # Formatting
@@ -640,6 +1089,15 @@ class Challenge:
         """
         return joint.join(str(x) for x in integers)
 
+    def write_list_of_integers(self, writer, integers, joint: str = ', '):
+        """Write a list of integers in chunks, like format_list_of_integers().
+
+        :param writer: object with a method write()
+        :param integers: iterable of integers
+        :param joint: joint between the integers
+        """
+        self.write_joined(writer, map(str, integers), joint)
+
     def format_path(self, integers: list, backwards: bool = False):
         """Join a list of integers to path of nodes.
 
@@ -654,11 +1112,55 @@ class Challenge:
 
     def format_permutations(self, permutations: list, separator: str = '\n',
                             element_separator: str = ' '):
-        entries = []
+        return separator.join(
+            self._permutation_entries(permutations, element_separator))
+
+    def write_permutations(self, writer, permutations, separator: str = '\n',
+                           element_separator: str = ' '):
+        """Write permutations in chunks, like format_permutations().
+
+        :param writer: object with a method write()
+        :param permutations: iterable of permutations
+        :param separator: separator between the permutations
+        :param element_separator: separator between the elements
+        """
+        self.write_joined(
+            writer, self._permutation_entries(permutations,
+                                              element_separator), separator)
+
+    @staticmethod
+    def _permutation_entries(permutations, element_separator):
         for perm in permutations:
-            entry = '('
-            entry += element_separator.join(
-                ('+' if i > 0 else '') + str(i) for i in perm)
-            entry += ')'
-            entries.append(entry)
-        return separator.join(entries)
+            yield '(' + element_separator.join(
+                ('+' if i > 0 else '') + str(i) for i in perm) + ')'
+
+    # noinspection PyMethodMayBeStatic
+    def write_joined(self, writer, strings, joint: str,
+                     chunk_size: int = 4096):
+        """Write strings with a joint in between, in chunks of strings.
+
+        Like writer.write(joint.join(strings)), but without building the
+        whole string.
+
+        :param writer: object with a method write()
+        :param strings: iterable of strings
+        :param joint: joint between the strings
+        :param chunk_size: number of strings joined per write
+        """
+        strings = iter(strings)
+        chunk = list(islice(strings, chunk_size))
+        while chunk:
+            writer.write(joint.join(chunk))
+            chunk = list(islice(strings, chunk_size))
+            if chunk:
+                writer.write(joint)
+
+
+Challenge._compile_patterns()
+
+
+def _is_integer_type(dtype):
+    """Check if dtype names an integer type, without importing NumPy."""
+    name = getattr(dtype, '__name__', str(dtype))
+    return name.lstrip('u').startswith('int')
+
@@ -0,0 +1,189 @@
+"""Transparent decompression of input files
+
+Compressed input files are detected by their magic bytes, not by their
+suffix, and decompressed as a stream while the lines are read. No
+decompressed copy is written to disk.
+
+The formats gzip, bzip2 and xz are supported by the standard library.
+Zstandard needs the optional package `zstandard`.
+"""
+
+import codecs
+import io
+import re
+
+formats = {
+    'gz': re.compile(re.escape(b'\x1f\x8b')),
+    'bz2': re.compile(rb'BZh[1-9](1AY&SY|\x17rE8P\x90)'),
+    'xz': re.compile(re.escape(b'\xfd7zXZ\x00')),
+    'zst': re.compile(re.escape(b'\x28\xb5\x2f\xfd')),
+}
+"""Patterns of the magic bytes by the suffix of each format.
+
+The header of bzip2 is matched in full, the block size digit followed by
+the magic of the first block or of the end of an empty stream. Plain text
+starting with "BZh" is not taken for bzip2.
+"""
+
+
+def detect(path: str):
+    """Detect the compression of a file by its magic bytes.
+
+    :param path: path of the file
+    :return: suffix of the format, i.e. 'gz', or None if not compressed
+    """
+    with open(path, 'rb') as pointer:
+        head = pointer.read(10)
+    for suffix, magic in formats.items():
+        if magic.match(head):
+            return suffix
+    return None
+
+
+def open_input(path: str, encoding: str = 'utf-8'):
+    """Open a text file for reading, decompressing it if needed.
+
+    A compressed file is returned as a TextReader. It supports read(),
+    iteration over lines and close(), not the full file protocol.
+
+    :param path: path of the file
+    :param encoding: encoding of the text, None to read bytes
+    :return: file object or TextReader
+    """
+    suffix = detect(path)
+    if suffix is None and encoding is None:
+        return open(path, 'rb')
+    elif suffix is None:
+        return open(path, encoding=encoding)
+    return TextReader(open_compressed(path, suffix, 'rb'), encoding)
+
+
+def open_compressed(path: str, suffix: str, mode: str = 'r',
+                    encoding: str = 'utf-8'):
+    """Open a text file in the given compression format.
+
+    :param path: path of the file
+    :param suffix: suffix of the format or None for plain text
+    :param mode: 'r' or 'w' for text, 'rb' or 'wb' for binary
+    :param encoding: encoding of the text
+    :return: file object
+    """
+    binary = mode.endswith('b')
+    mode = mode.rstrip('b')
+    if suffix is None:
+        stream = open(path, mode + 'b')
+    elif suffix == 'gz':
+        import gzip
+        stream = gzip.open(path, mode + 'b')
+    elif suffix == 'bz2':
+        import bz2
+        stream = bz2.open(path, mode + 'b')
+    elif suffix == 'xz':
+        import lzma
+        stream = lzma.open(path, mode + 'b')
+    elif suffix == 'zst':
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError('Install the package zstandard to read and '
+                              'write .zst files.') from None
+        pointer = open(path, mode + 'b')
+        if mode == 'r':
+            stream = zstandard.ZstdDecompressor().stream_reader(pointer,
+                                                                closefd=True)
+        else:
+            stream = zstandard.ZstdCompressor().stream_writer(pointer,
+                                                              closefd=True)
+    else:
+        raise ValueError('Unknown compression ' + suffix)
+    if binary:
+        return stream
+    return io.TextIOWrapper(stream, encoding=encoding)
+
+
+class TextReader:
+    """Decoded lines of a binary stream, split chunk by chunk.
+
+    Iterating a text wrapper of a decompressing stream passes each line
+    through several layers of io written in Python. Here the text is
+    decoded and split into lines in chunks of a megabyte, which is faster
+    than decompressing to disk first.
+
+    Lines keep their line ends. They are split like a file iterates them,
+    at \\n, \\r\\n and \\r, but not at other breaks of str.splitlines(),
+    like a form feed. Without an encoding the lines are bytes, split at
+    \\n only, like a file opened in binary mode.
+    """
+
+    chunk_size = 1 << 20
+
+    line_patterns = {
+        str: re.compile(r'[^\r\n]*(?:\r\n?|\n)|[^\r\n]+\Z'),
+        bytes: re.compile(rb'[^\n]*\n|[^\n]+\Z'),
+    }
+    """Patterns of a line by type, for chunks with other line breaks."""
+
+    def __init__(self, stream, encoding: str = 'utf-8'):
+        self.stream = stream
+        self.decoder = None
+        self.empty = b''
+        if encoding is not None:
+            self.decoder = codecs.getincrementaldecoder(encoding)()
+            self.empty = ''
+        self.lines = []  # Reversed, to pop from the end
+        self.rest = self.empty
+
+    def read(self, size: int = -1):
+        """Read the text of the next size bytes or all of it."""
+        text = self.empty.join(reversed(self.lines)) + self.rest
+        self.lines = []
+        self.rest = self.empty
+        while True:
+            data = self.stream.read(size)
+            text += self.decode(data)
+            if text or not data:
+                return text
+
+    def decode(self, data: bytes):
+        if self.decoder is None:
+            return data
+        return self.decoder.decode(data, final=not data)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while not self.lines:
+            if not self._fill():
+                raise StopIteration
+        return self.lines.pop()
+
+    def _fill(self):
+        data = self.stream.read(self.chunk_size)
+        text = self.rest + self.decode(data)
+        if not data:
+            self.rest = self.empty
+            self.lines = [text] if text else []
+            return bool(text)
+        self.lines = self._split(text)
+        self.rest = self.lines.pop() if self.lines else self.empty
+        self.lines.reverse()
+        return True
+
+    def _split(self, text):
+        """Split into lines, the fast splitlines() if it is exact."""
+        lines = text.splitlines(True)
+        newline = '\n' if self.decoder is not None else b'\n'
+        if len(lines) == text.count(newline) + (
+                not text.endswith(newline) and len(text) > 0):
+            return lines  # No breaks, that a file doesn't split at
+        return self.line_patterns[type(text)].findall(text)
+
+    def close(self):
+        self.stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,5 +1,4 @@
 import argparse
-import glob
 import importlib
 import os
 import sys
@@ -12,6 +11,7 @@ class Conf:
         self.root = os.path.realpath('.')
         self.parser = None
         self.args = None
+        self.manifest = None
         path = '{0}/version.txt'.format(os.path.realpath(
             os.path.dirname(__file__)))
         with open(path) as f:
@@ -22,14 +22,88 @@ class Conf:
         self.parser.add_argument('challenge', nargs='?',
                                  help='the challenge to run, to scaffold or '
                                       'to test')
+        self.parser.add_argument('-a', '--all', action='store_true',
+                                 help='unittest all challenges in parallel, '
+                                      'together with --unittest')
+        self.parser.add_argument('-b', '--batch', action='store', nargs='+',
+                                 metavar='FILE',
+                                 help='run the challenge over many files, '
+                                      'writing each output next to its input')
+        self.parser.add_argument('-B', '--bench', action='store_true',
+                                 help='benchmark the challenge on inputs of '
+                                      'growing size from its generate(n)')
+        self.parser.add_argument('--bytes', action='store_true',
+                                 help='read the input as bytes, without '
+                                      'decoding, for ASCII datasets')
+        self.parser.add_argument('-C', '--bench-compare', action='store',
+                                 nargs='?', const='', metavar='REVISION',
+                                 help='benchmark and compare to the results '
+                                      'stored for a revision, defaults to '
+                                      'the latest other revision')
+        self.parser.add_argument('--cache-size', action='store', type=int,
+                                 default=64, metavar='MB',
+                                 help='size limit of the result cache, '
+                                      'defaults to 64 MB')
         self.parser.add_argument('-f', '--file', action='store',
                                  help='load sample from given file')
+        self.parser.add_argument('-j', '--jobs', action='store', type=int,
+                                 help='number of processes for --batch '
+                                      'and --unittest --all, defaults to '
+                                      'the number of CPUs')
         self.parser.add_argument('-k', '--klass', action='store_true',
                                  help='use sample form challenge class file')
         self.parser.add_argument('-l', '--list', action='store_true',
                                  help='list challenges')
+        self.parser.add_argument('-m', '--mmap', action='store_true',
+                                 help='memory map the file given by --file')
+        self.parser.add_argument('-M', '--memory-limit', action='store',
+                                 type=int, metavar='MB',
+                                 help='run the challenge in a child process '
+                                      'with limited address space')
+        self.parser.add_argument('--no-cache', action='store_true',
+                                 help='run the challenge even if its result '
+                                      'is cached')
+        self.parser.add_argument('-o', '--output', action='store',
+                                 default='files', choices=('files', 'stdout'),
+                                 help='write the output to stdout and the '
+                                      'latest.txt files, or to stdout only')
+        self.parser.add_argument('-p', '--profile', action='store', nargs='?',
+                                 const='calc', choices=('calc', 'all'),
+                                 help='profile calc or all phases by cProfile '
+                                      'into profile.prof of the challenge '
+                                      'directory')
+        self.parser.add_argument('-r', '--repeat', action='store', type=int,
+                                 default=3,
+                                 help='number of timed runs per size for '
+                                      '--bench, defaults to 3')
         self.parser.add_argument('-s', '--scaffold', action='store_true',
                                  help="scaffold challenge")
+        self.parser.add_argument('-S', '--stream', action='store_true',
+                                 help='stream lines lazily from the file '
+                                      'given by --file')
+        self.parser.add_argument('--sizes', action='store', type=int,
+                                 nargs='+', default=[1000, 10000, 100000],
+                                 metavar='N',
+                                 help='input sizes for --bench, defaults to '
+                                      '1000 10000 100000')
+        self.parser.add_argument('--serve', action='store_true',
+                                 help='keep a warm process serving requests '
+                                      'on a Unix socket')
+        self.parser.add_argument('--socket', action='store',
+                                 help='socket path of --serve, defaults to '
+                                      '.challenge.sock')
+        self.parser.add_argument('--timeout', action='store', type=float,
+                                 metavar='SECONDS',
+                                 help='run the challenge in a child process '
+                                      'and stop it after the timeout')
+        self.parser.add_argument('-t', '--trace-memory', action='store_true',
+                                 help='trace the peak memory of each phase, '
+                                      'shown by --verbose')
+        self.parser.add_argument('-T', '--threshold', action='store',
+                                 type=float, default=0.1,
+                                 help='relative slowdown flagged as '
+                                      'regression by --bench-compare, '
+                                      'defaults to 0.1')
         self.parser.add_argument('-u', '--unittest', action='store_true',
                                  help='unittest challenge')
         self.parser.add_argument('-v', '--verbose', action='store_true',
@@ -39,6 +113,10 @@ class Conf:
         self.parser.add_argument('-w', '--write', action='store_true',
                                  help='write input and sample file into '
                                       'challenge directory')
+        self.parser.add_argument('-z', '--compress', action='store',
+                                 choices=('gz', 'bz2', 'xz', 'zst'),
+                                 help='compress the sample file written by '
+                                      '--write')
         if len(sys.argv) == 1:
             self.print_help()
         self.args = self.parser.parse_args()
@@ -67,8 +145,11 @@ class Conf:
     def get_input_file(self):
         return os.path.realpath(self.args.file)
 
-    def get_sample_file(self):
-        return os.path.realpath(self.get_challenge_dir() + '/sample.txt')
+    def get_sample_file(self, suffix=None):
+        path = self.get_challenge_dir() + '/sample.txt'
+        if suffix is not None:
+            path += '.' + suffix
+        return os.path.realpath(path)
 
     def get_result_file(self):
         return os.path.realpath(self.get_challenge_dir() + '/result.txt')
@@ -76,15 +157,39 @@ class Conf:
     def get_latest_file(self):
         return os.path.realpath(self.get_challenge_dir() + '/latest.txt')
 
+    def get_socket_file(self):
+        if self.args.socket:
+            return os.path.realpath(self.args.socket)
+        return os.path.realpath(self.root + '/.challenge.sock')
+
+    def get_cache_dir(self):
+        return os.path.realpath(self.root + '/.challenge-cache')
+
+    def get_bench_file(self):
+        return os.path.realpath(self.get_challenge_dir() + '/bench.json')
+
+    def get_profile_file(self):
+        return os.path.realpath(self.get_challenge_dir() + '/profile.prof')
+
     def get_latest_at_root(self):
         return os.path.realpath(self.root + '/latest.txt')
 
+    def get_manifest(self):
+        if self.manifest is None:
+            from challenges.manifest import Manifest
+            self.manifest = Manifest(self.root).load()
+        return self.manifest
+
     def get_challenges(self):
-        pattern = self.root + '/*/'
-        return [d for d in (os.path.basename(d[:-1])
-                            for d in glob.glob(pattern))
-                if d[0:1] == d[0:1].upper() and d[0:1] != '_'
-                ]
+        manifest = self.get_manifest().update()
+        manifest.save()
+        return sorted(manifest.entries)
+
+    def get_challenge_entry(self, challenge=None):
+        manifest = self.get_manifest()
+        entry = manifest.refresh(challenge or self.get_challenge_name())
+        manifest.save()
+        return entry
 
     def get_challenge_name(self):
         return self.args.challenge
@@ -0,0 +1,302 @@
+"""FASTA parsing of challenges
+
+This module holds the FASTA parser used by `Challenge.fasta()`. It also reads
+FASTA records directly from binary files or memory maps, without building a
+list of lines first.
+
+Sequences are accumulated as a list of chunks and joined once per record, so
+parsing is linear in the length of the input. Records are yielded lazily as
+tuples of id and sequence. The sequence is either a str or, on request,
+bytes for downstream vectorized comparison. So is the id.
+"""
+
+import mmap
+import os
+import re
+from itertools import chain
+
+FASTA_PATTERN = r'^[\-\*A-Z]+$'
+"""Reg expression for FASTA sequences, the default of Challenge."""
+
+
+def parse_fasta(lines, pattern=FASTA_PATTERN, as_bytes: bool = False,
+                ids_as_bytes: bool = False):
+    """Generator to parse FASTA records from stripped lines.
+
+    The lines may be str or bytes, but not mixed. Parsing stops at the first
+    line, that is neither a header nor matches the pattern. The final record
+    is always yielded, even if empty.
+
+    :param lines: iterable of stripped lines
+    :param pattern: reg expression of sequence lines, str or compiled
+    :param as_bytes: yield sequences as bytes
+    :param ids_as_bytes: yield ids as bytes
+    :return: generator of tuples (id, sequence)
+    """
+    lines = iter(lines)
+    first = next(lines, '')
+    binary = isinstance(first, bytes)
+    match = _compile(pattern, binary).match
+    header, empty = (b'>', b'') if binary else ('>', '')
+    name, chunks = empty, []
+    for line in chain((first,), lines):
+        if line.startswith(header):
+            if name and chunks:
+                # Yield previous record if any
+                yield _record(name, chunks, empty, as_bytes, ids_as_bytes)
+            name, chunks = line[1:], []  # Reset
+        elif match(line):
+            chunks.append(line)
+        else:
+            break
+    # Yield final record
+    yield _record(name, chunks, empty, as_bytes, ids_as_bytes)
+
+
+def read_fasta(stream, pattern=FASTA_PATTERN, as_bytes: bool = False,
+               ids_as_bytes: bool = False):
+    """Generator to read FASTA records from a binary stream.
+
+    The stream may be a file opened in binary mode or a memory map. Empty
+    lines are skipped.
+
+    :param stream: object with a readline() method returning bytes
+    :param pattern: reg expression of sequence lines, str or compiled
+    :param as_bytes: yield sequences as bytes
+    :param ids_as_bytes: yield ids as bytes
+    :return: generator of tuples (id, sequence)
+    """
+    lines = (line.strip() for line in iter(stream.readline, b''))
+    yield from parse_fasta((line for line in lines if line), pattern,
+                           as_bytes, ids_as_bytes)
+
+
+def open_fasta(path: str, pattern=FASTA_PATTERN, as_bytes: bool = False,
+               ids_as_bytes: bool = False):
+    """Generator to read FASTA records from a memory mapped file.
+
+    :param path: path of the FASTA file
+    :param pattern: reg expression of sequence lines, str or compiled
+    :param as_bytes: yield sequences as bytes
+    :param ids_as_bytes: yield ids as bytes
+    :return: generator of tuples (id, sequence)
+    """
+    with open(path, 'rb') as pointer:
+        if not pointer.seek(0, 2):
+            yield from read_fasta(pointer, pattern, as_bytes, ids_as_bytes)
+            return
+        with mmap.mmap(pointer.fileno(), 0,
+                       access=mmap.ACCESS_READ) as mapped:
+            yield from read_fasta(mapped, pattern, as_bytes, ids_as_bytes)
+
+
+def _compile(pattern, binary: bool):
+    """Compile the pattern for str or bytes lines."""
+    if isinstance(pattern, re.Pattern):
+        if isinstance(pattern.pattern, bytes) == binary:
+            return pattern
+        pattern = pattern.pattern
+    if binary and isinstance(pattern, str):
+        pattern = pattern.encode('ascii')
+    elif not binary and isinstance(pattern, bytes):
+        pattern = pattern.decode('ascii')
+    return re.compile(pattern)
+
+
+def _record(name, chunks: list, empty, as_bytes: bool, ids_as_bytes: bool):
+    """Join the chunks of a record and convert to the requested types."""
+    sequence = empty.join(chunks)
+    if isinstance(name, bytes):
+        if not ids_as_bytes:
+            name = name.decode('utf-8')
+        if not as_bytes:
+            sequence = sequence.decode('ascii')
+    else:
+        if ids_as_bytes:
+            name = name.encode('utf-8')
+        if as_bytes:
+            sequence = sequence.encode('ascii')
+    return name, sequence
+
+
+class FastaIndex:
+    """Index of the records of a FASTA file for random access.
+
+    Like the `.fai` index of samtools faidx, the index holds one entry per
+    record: id, length of the sequence, offset of the sequence in the file,
+    bases per line and bytes per line. It is stored in a sidecar file next to
+    the FASTA file and reused by later runs as long as it is not older than
+    the FASTA file.
+
+    A record is fetched by id or position with a single seek and read. The
+    line breaks are removed by a translate table.
+
+    Records with irregular line widths are indexed as a single line, with the
+    length as bases per line and the bytes spanned as bytes per line.
+    """
+
+    suffix = '.fai'
+    """Suffix of the sidecar file appended to the path of the FASTA file."""
+
+    def __init__(self, path: str, entries: list):
+        """Set up the index from its entries.
+
+        Use FastaIndex.load() to build or load the index of a file.
+
+        :param path: path of the FASTA file
+        :param entries: list of tuples (id, length, offset, bases, width)
+        """
+        self.path = path
+        """The path of the FASTA file."""
+
+        self.ids = [entry[0] for entry in entries]
+        """The ids of the records in order of the file."""
+
+        self.entries = {entry[0]: entry[1:] for entry in entries}
+        """Dict, ids as keys and tuples (length, offset, bases, width)."""
+
+        self._file = None
+
+    @classmethod
+    def load(cls, path: str):
+        """Load the index of a FASTA file from its sidecar.
+
+        If the sidecar is missing or outdated, the index is built and the
+        sidecar is written, if possible.
+
+        :param path: path of the FASTA file
+        :return: FastaIndex
+        """
+        sidecar = path + cls.suffix
+        try:
+            if os.path.getmtime(sidecar) >= os.path.getmtime(path):
+                with open(sidecar) as pointer:
+                    entries = [cls._parse_entry(line) for line in pointer]
+                return cls(path, entries)
+        except (OSError, ValueError):
+            pass
+        index = cls.build(path)
+        try:
+            index.write()
+        except OSError:
+            pass  # Not writable, keep the index in memory
+        return index
+
+    @classmethod
+    def build(cls, path: str):
+        """Build the index by one scan of the FASTA file.
+
+        :param path: path of the FASTA file
+        :return: FastaIndex
+        """
+        entries = []
+        record = None
+        offset = 0
+        with open(path, 'rb') as pointer:
+            for raw in pointer:
+                if raw.startswith(b'>'):
+                    if record:
+                        entries.append(record.entry())
+                    record = _IndexedRecord(raw[1:].strip().decode('utf-8'),
+                                            offset + len(raw))
+                elif record and raw.strip():
+                    record.add_line(raw, offset)
+                offset += len(raw)
+        if record:
+            entries.append(record.entry())
+        return cls(path, entries)
+
+    def write(self):
+        """Write the index into its sidecar file."""
+        with open(self.path + self.suffix, 'w') as pointer:
+            for name in self.ids:
+                pointer.write('\t'.join(
+                    [name] + [str(i) for i in self.entries[name]]) + '\n')
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def fetch(self, name: str, as_bytes: bool = False):
+        """Fetch the sequence of a record by id.
+
+        :param name: id of the record
+        :param as_bytes: return the sequence as bytes
+        :return: sequence
+        """
+        length, offset, bases, width = self.entries[name]
+        if bases:
+            lines, rest = divmod(length, bases)
+            span = lines * width + rest
+        else:
+            span = 0
+        if self._file is None:
+            self._file = open(self.path, 'rb')
+        self._file.seek(offset)
+        sequence = self._file.read(span).translate(None, b'\r\n')
+        return sequence if as_bytes else sequence.decode('ascii')
+
+    def fetch_at(self, position: int, as_bytes: bool = False):
+        """Fetch a record by its position in the file.
+
+        :param position: index of the record
+        :param as_bytes: return the sequence as bytes
+        :return: tuple (id, sequence)
+        """
+        name = self.ids[position]
+        return name, self.fetch(name, as_bytes)
+
+    def close(self):
+        """Close the FASTA file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @staticmethod
+    def _parse_entry(line: str):
+        """Parse a line of the sidecar into an entry."""
+        name, *numbers = line.rstrip('\n').split('\t')
+        if len(numbers) != 4:
+            raise ValueError('Invalid index line: ' + line)
+        return (name, *(int(number) for number in numbers))
+
+
+class _IndexedRecord:
+    """Collects the index entry of a record while building a FastaIndex."""
+
+    __slots__ = ('name', 'offset', 'length', 'bases', 'width', 'end',
+                 'regular', 'short')
+
+    def __init__(self, name: str, offset: int):
+        self.name = name
+        self.offset = offset
+        self.length = self.bases = self.width = 0
+        self.end = offset
+        self.regular = True
+        self.short = False
+
+    def add_line(self, raw: bytes, offset: int):
+        """Account for a sequence line at offset."""
+        bases = len(raw.rstrip(b'\r\n'))
+        if offset != self.end:
+            self.regular = False  # Empty lines in between
+        if not self.bases:
+            self.bases, self.width = bases, len(raw)
+        elif (self.short or bases > self.bases
+              or bases == self.bases and len(raw) != self.width):
+            self.regular = False
+        if bases < self.bases:
+            self.short = True
+        self.length += bases
+        self.end = offset + len(raw)
+
+    def entry(self):
+        """Get the entry as tuple (id, length, offset, bases, width)."""
+        if self.regular:
+            return (self.name, self.length, self.offset, self.bases,
+                    self.width)
+        else:
+            return (self.name, self.length, self.offset, self.length,
+                    self.end - self.offset)
@@ -0,0 +1,129 @@
+"""Graph representations of challenges
+
+This module holds the edge type and compact graph types built by the graph
+helpers of `Challenge`.
+"""
+
+from array import array
+
+
+class Edge:
+    """Edge of a graph with an optional weight.
+
+    A lightweight type without an instance dict. The weight is None if the
+    edge is unweighted.
+    """
+
+    __slots__ = ('tail', 'head', 'weight')
+
+    def __init__(self, tail: int, head: int, weight: int = None):
+        self.tail = tail
+        self.head = head
+        self.weight = weight
+
+    def __eq__(self, other):
+        if not isinstance(other, Edge):
+            return NotImplemented
+        return (self.tail == other.tail and self.head == other.head
+                and self.weight == other.weight)
+
+    def __repr__(self):
+        return 'Edge(tail={!r}, head={!r}, weight={!r})'.format(
+            self.tail, self.head, self.weight)
+
+
+class CsrGraph:
+    """Array backed graph in compressed sparse row format.
+
+    Node ids are remapped to positions `0 .. node_count - 1` in the order of
+    the sorted ids. The heads of the edges are stored grouped by the position
+    of their tail. The edges of the tail at position `i` are found between
+    `offsets[i]` and `offsets[i + 1]`. Slicing out the neighbors of a node
+    is O(1) by memoryviews.
+
+    Attributes:
+
+    :nodes:     array of the node ids, sorted, indexed by position
+    :index:     dict, node id as key and position as value
+    :offsets:   array of the edge offsets per position, node_count + 1 items
+    :heads:     array of the positions of the heads of the edges
+    :weights:   array of the weights of the edges or None if unweighted
+    """
+
+    __slots__ = ('nodes', 'index', 'offsets', 'heads', 'weights')
+
+    def __init__(self, tails, heads, weights=None):
+        """Build the graph from parallel sequences of edges.
+
+        A weight of None in a weighted graph is stored as 0.
+
+        :param tails: node ids of the tails of the edges
+        :param heads: node ids of the heads of the edges
+        :param weights: weights of the edges or None if unweighted
+        """
+        self.nodes = array('q', sorted(set(tails).union(heads)))
+        self.index = {node: position
+                      for position, node in enumerate(self.nodes)}
+        index = self.index
+        counts = array('q', bytes(8 * (len(self.nodes) + 1)))
+        for tail in tails:
+            counts[index[tail] + 1] += 1
+        for position in range(len(self.nodes)):
+            counts[position + 1] += counts[position]
+        self.offsets = counts
+        cursors = array('q', counts)
+        self.heads = array('q', bytes(8 * len(tails)))
+        self.weights = array('q', self.heads) if weights is not None else None
+        for edge, (tail, head) in enumerate(zip(tails, heads)):
+            position = index[tail]
+            cursor = cursors[position]
+            self.heads[cursor] = index[head]
+            if weights is not None:
+                self.weights[cursor] = weights[edge] or 0
+            cursors[position] = cursor + 1
+
+    @property
+    def node_count(self):
+        return len(self.nodes)
+
+    @property
+    def edge_count(self):
+        return len(self.heads)
+
+    def neighbor_positions(self, position: int):
+        """Get the positions of the heads of the node at position.
+
+        :param position: position of the tail node
+        :return: memoryview of positions
+        """
+        offsets = self.offsets
+        return memoryview(self.heads)[offsets[position]:offsets[position + 1]]
+
+    def neighbor_weights(self, position: int):
+        """Get the weights of the edges of the node at position.
+
+        :param position: position of the tail node
+        :return: memoryview of weights
+        """
+        offsets = self.offsets
+        return memoryview(self.weights)[
+            offsets[position]:offsets[position + 1]]
+
+    def neighbors(self, node: int):
+        """Get the node ids of the heads of the edges of a node.
+
+        :param node: node id of the tail
+        :return: list of node ids
+        """
+        nodes = self.nodes
+        return [nodes[head] for head in
+                self.neighbor_positions(self.index[node])]
+
+    def degree(self, node: int):
+        """Get the number of outgoing edges of a node.
+
+        :param node: node id of the tail
+        :return: out degree
+        """
+        position = self.index[node]
+        return self.offsets[position + 1] - self.offsets[position]
@@ -0,0 +1,96 @@
+import multiprocessing
+import time
+
+
+class LimitExceeded(Exception):
+    """A guarded challenge exceeded a limit or died.
+
+    :ivar limit: 'timeout', 'memory' or 'exit'
+    :ivar phase: the active phase of the challenge or None
+    """
+
+    def __init__(self, limit: str, detail, phase: str = None):
+        self.limit = limit
+        self.detail = detail
+        self.phase = phase
+        if limit == 'timeout':
+            message = 'Timeout of {} s exceeded'.format(detail)
+        elif limit == 'memory':
+            message = 'Memory limit of {} MB exceeded'.format(detail)
+        else:
+            message = 'Died with exit code {}'.format(detail)
+        if phase is not None:
+            message += ' in phase ' + phase
+        super().__init__(message)
+
+
+def run_guarded(function, timeout: float = None, memory: int = None):
+    """Run a function in a child process within a timeout and memory limit.
+
+    The child is forked, so the function and its arguments are not
+    pickled, but its return value is. It is called with a callable to
+    report the active phase, i.e. to set as Challenge.phase_callback.
+
+        value = run_guarded(lambda report: work(report), timeout=10)
+
+    The memory limit caps the address space of the child by RLIMIT_AS. An
+    exception of the child is raised again in the parent.
+
+    :param function: callable taking the report callable
+    :param timeout: wall clock seconds or None
+    :param memory: megabytes of address space or None
+    :return: the return value of the function
+    :raise LimitExceeded: if the child is stopped or dies
+    """
+    context = multiprocessing.get_context('fork')
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_child,
+                              args=(function, sender, memory), daemon=True)
+    process.start()
+    sender.close()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    phase = None
+    try:
+        while True:
+            remaining = None
+            if deadline is not None:
+                remaining = max(deadline - time.monotonic(), 0)
+            if not receiver.poll(remaining):
+                raise LimitExceeded('timeout', timeout, phase)
+            try:
+                kind, value = receiver.recv()
+            except EOFError:
+                process.join()
+                raise LimitExceeded('exit', process.exitcode, phase)
+            if kind == 'phase':
+                phase = value
+            elif kind == 'result':
+                return value
+            elif isinstance(value, MemoryError) and memory is not None:
+                raise LimitExceeded('memory', memory, phase)
+            else:
+                raise value
+    finally:
+        receiver.close()
+        if process.is_alive():
+            process.join(0.1)
+        if process.is_alive():
+            process.kill()
+            process.join()
+
+
+def _child(function, sender, memory):
+    if memory is not None:
+        import resource
+        limit = memory * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    try:
+        value = function(lambda phase: sender.send(('phase', phase)))
+    except BaseException as error:
+        try:
+            sender.send(('error', error))
+        except Exception:  # Not picklable
+            sender.send(('error', RuntimeError(repr(error))))
+    else:
+        sender.send(('result', value))
+    sender.close()
@@ -0,0 +1,222 @@
+"""Line sources of challenges
+
+This module holds alternatives to the list of lines, that the method
+`Challenge.read()` builds from the sample string. They are injected into
+`Challenge.source` by the runner to process large input files.
+
+The lines are normalised just like `normalise()` does for `Challenge.read()`:
+each line is stripped and leading and trailing empty lines are dropped.
+"""
+
+import mmap
+from array import array
+from collections.abc import Sequence
+
+from challenges.compression import detect, open_input
+
+
+def normalise(text):
+    """Split a text into normalised lines in one pass.
+
+    Each line is stripped and leading and trailing empty lines are dropped.
+    The text is split just once. A line without surrounding whitespace is
+    the very object of the split, not a copy of it, so the lines take
+    about the memory of one split of the text.
+
+    :param text: str or bytes
+    :return: list of lines of the type of the text
+    """
+    lines = [line.strip() for line in text.splitlines()]
+    first = 0
+    while first < len(lines) and not lines[first]:
+        first += 1
+    last = len(lines)
+    while last > first and not lines[last - 1]:
+        last -= 1
+    del lines[last:]
+    del lines[:first]
+    return lines
+
+
+class StreamLines(Sequence):
+    """Lazily materialised, line indexed view over an input file.
+
+    Lines are read from the file and normalised just when they are accessed
+    by index or iteration for the first time. The file itself is never held
+    in memory as a whole, so the peak memory stays near one copy of the
+    input, the list of the lines read so far.
+
+    Accessing a negative index or asking for the length reads the file up to
+    its end.
+
+    With as_bytes the lines are bytes, that are not decoded at all.
+    """
+
+    def __init__(self, path: str, encoding: str = 'utf-8',
+                 as_bytes: bool = False):
+        self.path = path
+        """The path of the input file."""
+
+        self._file = open_input(path, None if as_bytes else encoding)
+        self._empty = b'' if as_bytes else ''
+        self._lines = []
+        self._blanks = 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if index.stop is None or index.stop < 0 or (
+                    index.start is not None and index.start < 0):
+                self._fill()
+            else:
+                self._fill(index.stop)
+        elif index < 0:
+            self._fill()
+        else:
+            self._fill(index + 1)
+        return self._lines[index]
+
+    def __len__(self):
+        self._fill()
+        return len(self._lines)
+
+    def __iter__(self):
+        nr = 0
+        while True:
+            if nr < len(self._lines):
+                yield self._lines[nr]
+                nr += 1
+            elif not self._read_next():
+                return
+
+    def close(self):
+        """Close the file. Lines read so far stay accessible."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _fill(self, count: int = None):
+        """Read lines until count lines are materialised or the file ends.
+
+        :param count: number of lines, all lines if not given
+        """
+        while count is None or len(self._lines) < count:
+            if not self._read_next():
+                break
+
+    def _read_next(self):
+        """Materialise the next non empty line.
+
+        Empty lines are held back until a non empty line follows, so that
+        trailing empty lines are dropped. Leading empty lines are skipped.
+
+        :return: False if the end of the file is reached
+        """
+        if self._file is None:
+            return False
+        for raw in self._file:
+            line = raw.strip()
+            if not line:
+                if self._lines:
+                    self._blanks += 1
+                continue
+            if self._blanks:
+                self._lines += [self._empty] * self._blanks
+                self._blanks = 0
+            self._lines.append(line)
+            return True
+        self.close()
+        return False
+
+
+class MappedLines(Sequence):
+    """Memory mapped, line indexed view over an input file.
+
+    The file is mapped into memory and the offsets of the line starts are
+    collected into a compact array in one scan for newlines. A line is
+    decoded from its slice of the mapping just when it is accessed. No list of
+    strings is built, so random access to single lines of huge files is
+    cheap and the startup is proportional to one scan of the file.
+
+    With as_bytes the lines are bytes, that are not decoded at all.
+    """
+
+    def __init__(self, path: str, encoding: str = 'utf-8',
+                 as_bytes: bool = False):
+        self.path = path
+        """The path of the input file."""
+
+        self.encoding = None if as_bytes else encoding
+        """The encoding used to decode the lines, None for bytes."""
+
+        self._map = None
+        self._offsets = array('Q')
+        if detect(path) is not None:
+            raise ValueError('Can not memory map the compressed file {}, '
+                             'stream it instead.'.format(path))
+        with open(path, 'rb') as pointer:
+            if pointer.seek(0, 2):
+                self._map = mmap.mmap(pointer.fileno(), 0,
+                                      access=mmap.ACCESS_READ)
+        if self._map is not None:
+            self._index()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[nr] for nr in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('line index out of range')
+        return self._line(index)
+
+    def __len__(self):
+        return max(len(self._offsets) - 1, 0)
+
+    def __iter__(self):
+        if self.encoding is None:
+            for nr in range(len(self)):
+                yield self._slice(nr).strip()
+        else:
+            for nr in range(len(self)):
+                yield self._slice(nr).decode(self.encoding).strip()
+
+    def close(self):
+        """Close the mapping."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+            self._offsets = array('Q')
+
+    def _line(self, nr: int):
+        """Get a normalised line."""
+        if self.encoding is None:
+            return self._slice(nr).strip()
+        return self._slice(nr).decode(self.encoding).strip()
+
+    def _slice(self, nr: int):
+        """Get the raw bytes of a line including its line break."""
+        return self._map[self._offsets[nr]:self._offsets[nr + 1]]
+
+    def _index(self):
+        """Collect the line offsets, drop leading and trailing empty lines.
+
+        The offsets hold the start of each line followed by the end of the
+        last line.
+        """
+        offsets = self._offsets
+        offsets.append(0)
+        find = self._map.find
+        position = find(b'\n')
+        while position != -1:
+            offsets.append(position + 1)
+            position = find(b'\n', position + 1)
+        if offsets[-1] != len(self._map):
+            offsets.append(len(self._map))
+        first = 0
+        while first < len(self) and not self._slice(first).strip():
+            first += 1
+        del offsets[:first]
+        last = len(self) - 1
+        while last >= 0 and not self._slice(last).strip():
+            last -= 1
+        del offsets[last + 2:]
@@ -1,6 +1,5 @@
-from challenges.conf import Conf
-from challenges.runner import Runner
-
-
 def main():
+    """Run the command line. The runner is imported by the call."""
+    from challenges.conf import Conf
+    from challenges.runner import Runner
     Runner(Conf()).main()
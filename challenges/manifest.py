@@ -0,0 +1,104 @@
+import json
+import os
+
+
+class Manifest:
+    """Cached index of the challenge directories below the root.
+
+    The manifest is stored as JSON into the root directory. It holds one
+    entry per challenge directory, keyed by the name of the challenge:
+
+    :module:    module of the challenge class or None if there is none
+    :unittest:  module of the unittest class or None if there is none
+    :mtime:     modification time of the directory
+    :sample:    True if the directory holds a stored sample.txt, maybe
+                compressed
+    :result:    True if the directory holds a stored result.txt
+
+    On update the root is listed once, but only directories with a changed
+    modification time are scanned again. Adding or removing files changes
+    the modification time of a directory.
+    """
+
+    file_name = '.challenges.json'
+    """Name of the manifest file in the root directory."""
+
+    def __init__(self, root: str):
+        self.root = root
+        self.path = os.path.join(root, self.file_name)
+        self.entries = {}
+        self.changed = False
+
+    def load(self):
+        """Load the entries from the manifest file, if any."""
+        try:
+            with open(self.path) as pointer:
+                self.entries = json.load(pointer)
+        except (OSError, ValueError):
+            self.entries = {}
+        return self
+
+    def save(self):
+        """Write the entries into the manifest file, if changed."""
+        if not self.changed:
+            return
+        temporary = self.path + '.tmp'
+        try:
+            with open(temporary, 'w') as pointer:
+                json.dump(self.entries, pointer, indent=4, sort_keys=True)
+            os.replace(temporary, self.path)
+        except OSError:
+            pass  # Not writable, the manifest is rebuilt next time
+        self.changed = False
+
+    def update(self):
+        """Rescan changed challenge directories and drop removed ones."""
+        names = set()
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                if self.is_challenge_name(entry.name) and entry.is_dir():
+                    names.add(entry.name)
+                    self.refresh(entry.name, entry.stat().st_mtime)
+        for name in set(self.entries) - names:
+            del self.entries[name]
+            self.changed = True
+        return self
+
+    def refresh(self, name: str, mtime: float = None):
+        """Rescan one challenge directory if its modification time changed.
+
+        :param name: name of the challenge
+        :param mtime: modification time of the directory, if known
+        :return: the entry or None if there is no such directory
+        """
+        if not self.is_challenge_name(name):
+            return None
+        directory = os.path.join(self.root, name)
+        if mtime is None:
+            try:
+                mtime = os.stat(directory).st_mtime
+            except OSError:
+                if self.entries.pop(name, None) is not None:
+                    self.changed = True
+                return None
+        entry = self.entries.get(name)
+        if entry is None or entry['mtime'] != mtime:
+            files = set(os.listdir(directory))
+            entry = {
+                'module': name + '.challenge'
+                if 'challenge.py' in files else None,
+                'unittest': name + '.test' if 'test.py' in files else None,
+                'mtime': mtime,
+                'sample': any(file.startswith('sample.txt')
+                              for file in files),
+                'result': 'result.txt' in files,
+            }
+            self.entries[name] = entry
+            self.changed = True
+        return entry
+
+    @staticmethod
+    def is_challenge_name(name: str):
+        """Challenge directories start with an uppercase character."""
+        first = name[0:1]
+        return first == first.upper() and first not in ('_', '.', '')
@@ -0,0 +1,173 @@
+"""Memoization and explicit stack recursion for challenge methods.
+
+Memoize a method, keyed on its arguments without `self`::
+
+    class MyChallenge(Challenge):
+
+        @memoize(maxsize=10000)
+        def count(self, n, k):
+            ...
+
+Turn a deep recursion into a loop over an explicit stack. The method becomes
+a generator, that yields each recursive call instead of calling it::
+
+        @trampoline
+        def depth(self, node):
+            deepest = 0
+            for child in self.model[node]:
+                deepest = max(deepest, (yield self.depth(child)))
+            return deepest + 1
+
+Both combine, memoize on top of trampoline. The statistics of hits, misses
+and evictions of each memoized method are shown by `--verbose`.
+"""
+
+import functools
+import threading
+import types
+from collections import OrderedDict
+
+registry = []
+"""All memoized methods in order of definition."""
+
+_keywords = object()
+"""Separates positional from keyword arguments in a key."""
+
+_local = threading.local()
+"""Per thread, the set `running` of the trampolines driving a stack."""
+
+
+class Memo:
+    """Bounded least recently used cache of a method.
+
+    The cache is kept per instance, so that a new challenge does not see the
+    results of another one. The statistics are kept per method over all
+    instances.
+    """
+
+    def __init__(self, function, maxsize=None):
+        functools.update_wrapper(self, function)
+        self.function = function
+        self.maxsize = maxsize
+        self.name = function.__qualname__
+        self.attribute = '_memo_' + function.__qualname__  # Apart per class
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        registry.append(self)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return types.MethodType(self, instance)
+
+    def __call__(self, instance, *args, **kwargs):
+        cache = instance.__dict__.get(self.attribute)
+        if cache is None:
+            cache = instance.__dict__[self.attribute] = OrderedDict()
+        key = args
+        if kwargs:
+            key += (_keywords,) + tuple(sorted(kwargs.items()))
+        if key in cache:
+            self.hits += 1
+            cache.move_to_end(key)
+            value = cache[key]
+            return _returning(value) if self.is_suspended() else value
+        self.misses += 1
+        value = self.function(instance, *args, **kwargs)
+        if self.is_suspended():
+            return self._storing(cache, key, value)
+        self.store(cache, key, value)
+        return value
+
+    def is_suspended(self):
+        """True if the call is a step of a running trampoline."""
+        return _is_running(self.function)
+
+    def store(self, cache, key, value):
+        cache[key] = value
+        if self.maxsize is not None and len(cache) > self.maxsize:
+            cache.popitem(last=False)
+            self.evictions += 1
+
+    def _storing(self, cache, key, generator):
+        value = yield generator
+        self.store(cache, key, value)
+        return value
+
+    def clear(self, instance):
+        """Drop the cached results of the instance."""
+        instance.__dict__.pop(self.attribute, None)
+
+
+def memoize(maxsize=1024):
+    """Decorate a method to memoize its results.
+
+    :param maxsize: maximal number of results per instance, None for no limit
+    """
+    def decorate(function):
+        return Memo(function, maxsize)
+    return decorate
+
+
+def trampoline(function):
+    """Decorate a generator method to recurse on an explicit stack.
+
+    Each recursive call is yielded and its value is sent back into the
+    generator. The value of the generator is returned. The depth of the
+    recursion is limited by memory only, not by the C stack.
+
+    Only calls of the method itself are steps of its stack. Other
+    trampolined methods called meanwhile run on a stack of their own and
+    return their value, whether they are yielded or called plainly. Each
+    thread drives its own stacks.
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        generator = function(*args, **kwargs)
+        if _is_running(wrapper):
+            return generator
+        running = _local.__dict__.setdefault('running', set())
+        running.add(wrapper)
+        try:
+            return _drive(generator)
+        finally:
+            running.discard(wrapper)
+    wrapper.trampolined = True
+    return wrapper
+
+
+def stats():
+    """Get the memoized methods, that have been called.
+
+    :return: list of Memo
+    """
+    return [memo for memo in registry if memo.hits or memo.misses]
+
+
+def _is_running(function):
+    """True if the trampoline of the function drives a stack."""
+    return function in getattr(_local, 'running', ())
+
+
+def _drive(generator):
+    stack = [generator]
+    value = None
+    while stack:
+        try:
+            call = stack[-1].send(value)
+        except StopIteration as stop:
+            stack.pop()
+            value = stop.value
+        else:
+            if isinstance(call, types.GeneratorType):
+                stack.append(call)
+                value = None
+            else:
+                value = call  # Value of another trampoline, send it back
+    return value
+
+
+def _returning(value):
+    return value
+    yield  # Makes it a generator
@@ -0,0 +1,132 @@
+import os
+
+
+class Tee:
+    """Write chunks of output to several destinations in one pass.
+
+    Files are written to a temporary file next to them and replaced on a
+    successful close, so that a failing challenge leaves the previous files
+    in place. While the output equals the content of a previous file, it is
+    just compared. An unchanged file is not written at all. The stream,
+    usually stdout, gets a final newline like print() does.
+
+        with Tee(['latest.txt', 'result.txt'], sys.stdout) as writer:
+            challenge.main(writer)
+    """
+
+    def __init__(self, paths: list, stream=None):
+        self.stream = stream
+        self.files = []
+        try:
+            for path in paths:
+                self.files.append(_File(path))
+        except OSError:
+            self.close(commit=False)
+            raise
+
+    def write(self, chunk: str):
+        if self.stream is not None:
+            self.stream.write(chunk)
+        if self.files:
+            data = chunk.encode('utf-8')
+            for file in self.files:
+                file.write(data)
+
+    def close(self, commit: bool = True):
+        """Close the files and replace the changed destinations by them.
+
+        :param commit: False to discard the written files
+        """
+        for file in self.files:
+            file.close(commit)
+        self.files = []
+        if commit and self.stream is not None:
+            self.stream.write('\n')
+            self.stream.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close(commit=exc_type is None)
+
+
+class _File:
+    """Destination file, that is written only from the first change on."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.temporary = path + '.tmp'
+        self.matched = 0
+        self.pointer = None
+        try:
+            self.previous = open(path, 'rb')
+        except FileNotFoundError:
+            self.previous = None
+            self.pointer = open(self.temporary, 'wb')
+
+    def write(self, data: bytes):
+        if self.pointer is None:
+            if self.previous.read(len(data)) == data:
+                self.matched += len(data)
+                return
+            self.diverge()
+        self.pointer.write(data)
+
+    def diverge(self):
+        """Start the temporary file with the matched part of the previous."""
+        self.pointer = open(self.temporary, 'wb')
+        self.previous.seek(0)
+        remaining = self.matched
+        while remaining:
+            block = self.previous.read(min(remaining, 1 << 20))
+            self.pointer.write(block)
+            remaining -= len(block)
+        self.previous.close()
+        self.previous = None
+
+    def close(self, commit: bool):
+        if self.pointer is None and commit and self.previous.read(1):
+            self.diverge()  # The previous file is longer
+        if self.previous is not None:
+            self.previous.close()
+        if self.pointer is not None:
+            self.pointer.close()
+            if commit:
+                os.replace(self.temporary, self.path)
+            else:
+                os.remove(self.temporary)
+
+
+def link_or_copy(source: str, target: str):
+    """Hard link the target to the source, copy if linking fails.
+
+    Nothing is done, if the target already is the same file.
+    """
+    try:
+        if os.path.samefile(source, target):
+            return
+    except OSError:
+        pass  # No target yet
+    temporary = target + '.tmp'
+    if os.path.lexists(temporary):
+        os.remove(temporary)
+    try:
+        os.link(source, temporary)
+    except OSError:
+        import shutil  # i.e. across devices
+        shutil.copyfile(source, temporary)
+    os.replace(temporary, target)
+
+
+def copy_if_changed(source: str, target: str):
+    """Copy a file unless the target has the same content.
+
+    :return: True if copied
+    """
+    import filecmp
+    import shutil
+    if os.path.exists(target) and filecmp.cmp(source, target, shallow=False):
+        return False
+    shutil.copyfile(source, target)
+    return True
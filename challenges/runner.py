@@ -1,32 +1,69 @@
+import os
 import sys
 import time
-import unittest
 
+from challenges.compression import detect, formats, open_compressed, \
+    open_input
+from challenges.lines import MappedLines, StreamLines
+from challenges.output import Tee, copy_if_changed, link_or_copy
 from challenges.scaffold import Scaffold
 
 
 class Runner:
+    """Run the challenge as given by the command line options.
+
+    Modules needed just by some of the modes, like unittest or the process
+    pool of the batch mode, are imported by the mode itself to keep the
+    startup of the command fast.
+    """
+
     def __init__(self, conf):
         self.start = time.time()
         self.conf = conf
+        self.cached = False
+        self.memo_stats = None
         conf.parse_arguments()
 
     def main(self):
         if self.conf.args.list:
             self.list_challenges()
+        elif self.conf.args.serve:
+            from challenges.server import Server
+            Server(self.conf).serve()
         elif self.conf.args.unittest:
-            if self.conf.args.challenge:
+            if self.conf.args.all:
+                from challenges.suite import Suite
+                Suite(self.conf).run()
+            elif self.conf.args.challenge:
                 self.run_unittest()
             else:
                 self.conf.print_help()
+        elif (self.conf.args.bench
+              or self.conf.args.bench_compare is not None):
+            if self.conf.args.challenge:
+                from challenges.bench import Bench
+                Bench(self.conf).bench()
+            else:
+                self.conf.print_help()
+        elif self.conf.args.batch:
+            if self.conf.args.challenge:
+                from challenges.batch import Batch
+                Batch(self.conf).run()
+            else:
+                self.conf.print_help()
         elif self.conf.args.scaffold:
             if self.conf.args.challenge:
                 Scaffold(self.conf).scaffold()
             else:
                 self.conf.print_help()
         elif self.conf.args.challenge:
-            self.run_challenge()
+            challenge = self.run_challenge()
             if self.conf.args.verbose:
+                if self.cached:
+                    print('--- Cached result ---')
+                else:
+                    self.print_timings(challenge)
+                    self.print_memo_stats(self.memo_stats)
                 print("--- Time: %s ---" % str(time.time() - self.start))
         else:
             self.conf.print_help()
@@ -34,12 +71,117 @@ class Runner:
     def run_challenge(self):
         challenge = self.conf.get_challenge()
         self.set_sample(challenge)
-        challenge.main()
-        self.write(challenge)
+        challenge.trace_memory = self.conf.args.trace_memory
+        if self.conf.args.profile:
+            self.set_profiler(challenge)
+        cache, key = self.get_cache(challenge)
+        if self.conf.args.timeout or self.conf.args.memory_limit:
+            self.run_guarded(challenge, cache, key)
+        else:
+            self.execute(challenge, cache, key)
+        return challenge
+
+    def run_guarded(self, challenge, cache=None, key=None):
+        """Execute the challenge in a child process within the limits.
+
+        The timings and the memo statistics are passed back to the parent.
+        If a limit is exceeded, the partially written output files, including
+        the one of the cache, are removed and the active phase is reported.
+        """
+        from challenges.guard import LimitExceeded, run_guarded
+
+        def execute(report):
+            challenge.phase_callback = report
+            self.execute(challenge, cache, key)
+            return challenge.timings, self.cached, self.get_memo_stats()
+
+        try:
+            challenge.timings, self.cached, self.memo_stats = run_guarded(
+                execute, self.conf.args.timeout, self.conf.args.memory_limit)
+        except LimitExceeded as error:
+            paths = self.get_output_files()
+            if cache is not None:
+                paths.append(cache.path(key))
+            for path in paths:
+                if os.path.exists(path + '.tmp'):
+                    os.remove(path + '.tmp')
+            sys.exit(str(error) + '.')
+        finally:
+            if challenge.source is not None:
+                challenge.source.close()  # The copy of the parent
+
+    def execute(self, challenge, cache=None, key=None):
+        if cache is not None:
+            challenge.output = cache.get(key)
+            self.cached = challenge.output is not None
+        paths = self.get_output_files()
+        if cache is not None and not self.cached:
+            paths.append(cache.prepare(key))
+        try:
+            with Tee(paths, sys.stdout) as writer:
+                if self.cached:
+                    writer.write(challenge.output)
+                else:
+                    challenge.main(writer)
+        finally:
+            if challenge.source is not None:
+                challenge.source.close()  # Not read to its end by all
+        if cache is not None and not self.cached:
+            cache.evict()
+        if self.conf.args.output == 'files':
+            link_or_copy(self.conf.get_latest_file(),
+                         self.conf.get_latest_at_root())
+        if challenge.profiler is not None:
+            challenge.profiler.dump_stats(self.conf.get_profile_file())
+        if self.conf.args.write:
+            self.write_sample(challenge)
+
+    def get_cache(self, challenge):
+        """Get the result cache and the key of this run.
+
+        Profiling and memory tracing want a real run, so do not use the
+        cache for them.
+
+        :return: tuple (cache, key) or (None, None) if not cached
+        """
+        args = self.conf.args
+        if args.no_cache or args.profile or args.trace_memory:
+            return None, None
+        from challenges.cache import ResultCache
+        cache = ResultCache(self.conf.get_cache_dir(),
+                            args.cache_size * 1024 * 1024)
+        module_file = sys.modules[type(challenge).__module__].__file__
+        if challenge.source is not None:
+            key = cache.key(self.conf.version, module_file,
+                            input_file=self.conf.get_input_file(),
+                            bytes_mode=challenge.bytes_mode)
+        else:
+            key = cache.key(self.conf.version, module_file,
+                            sample=challenge.sample,
+                            bytes_mode=challenge.bytes_mode)
+        return cache, key
+
+    def set_profiler(self, challenge):
+        import cProfile
+        challenge.profiler = cProfile.Profile()
+        if self.conf.args.profile == 'all':
+            challenge.profile_phases = challenge.phases
 
     def set_sample(self, challenge):
-        if self.conf.args.file:
-            challenge.sample = self.read_file()
+        if self.conf.args.bytes:
+            challenge.bytes_mode = True
+        as_bytes = challenge.bytes_mode
+        if self.conf.args.file and self.conf.args.mmap:
+            try:
+                challenge.source = MappedLines(self.conf.get_input_file(),
+                                               as_bytes=as_bytes)
+            except ValueError as error:
+                sys.exit(str(error))
+        elif self.conf.args.file and self.conf.args.stream:
+            challenge.source = StreamLines(self.conf.get_input_file(),
+                                           as_bytes=as_bytes)
+        elif self.conf.args.file:
+            challenge.sample = self.read_file(as_bytes)
         elif self.conf.args.klass:
             challenge.sample = challenge.sample
         else:
@@ -49,28 +191,103 @@ class Runner:
             else:
                 self.conf.print_help()
 
-    def read_file(self):
-        with open(self.conf.get_input_file(), 'r') as pointer:
+    def read_file(self, as_bytes=False):
+        encoding = None if as_bytes else 'utf-8'
+        with open_input(self.conf.get_input_file(), encoding) as pointer:
             sample = pointer.read()
         return sample
 
-    def write(self, challenge):
-        result = challenge.output
-        print(result)
-        with open(self.conf.get_latest_file(), 'w') as pointer:
-            pointer.write(result)
-        with open(self.conf.get_latest_at_root(), 'w') as pointer:
-            pointer.write(result)
+    def get_output_files(self):
+        """Get the files the output is written to, besides stdout.
+
+        The latest.txt of the base directory is linked to the one of the
+        challenge directory afterwards.
+        """
+        paths = []
+        if self.conf.args.output == 'files':
+            paths.append(self.conf.get_latest_file())
         if self.conf.args.write:
-            with open(self.conf.get_sample_file(), 'w') as pointer:
-                pointer.write(challenge.sample)
-            with open(self.conf.get_result_file(), 'w') as pointer:
-                pointer.write(result)
+            paths.append(self.conf.get_result_file())
+        return paths
+
+    def write_sample(self, challenge):
+        """Write the input into the sample file.
+
+        A compressed input file is copied as is, unless --compress asks for
+        another format. Samples of other formats are removed.
+        """
+        suffix = self.conf.args.compress
+        if self.conf.args.file:
+            source = self.conf.get_input_file()
+            detected = detect(source)
+            if suffix is None:
+                suffix = detected
+            path = self.conf.get_sample_file(suffix)
+            if suffix == detected:
+                copy_if_changed(source, path)
+            else:
+                import shutil
+                with open_input(source) as pointer:
+                    with open_compressed(path + '.tmp', suffix, 'w') as out:
+                        shutil.copyfileobj(pointer, out, 1 << 20)
+                os.replace(path + '.tmp', path)
+        else:
+            path = self.conf.get_sample_file(suffix)
+            if suffix is None:
+                with Tee([path]) as writer:
+                    writer.write(challenge.sample)
+            else:
+                with open_compressed(path + '.tmp', suffix, 'w') as pointer:
+                    pointer.write(challenge.sample)
+                os.replace(path + '.tmp', path)
+        for other in (None,) + tuple(formats):
+            if other != suffix and os.path.exists(
+                    self.conf.get_sample_file(other)):
+                os.remove(self.conf.get_sample_file(other))
+
+    @staticmethod
+    def print_timings(challenge):
+        print('--- {:<8}{:>12}{:>12}{:>12} ---'.format(
+            'Phase', 'Wall s', 'CPU s', 'Peak KiB'))
+        for name, timing in challenge.timings.items():
+            if timing.peak is None:
+                peak = '-'
+            else:
+                peak = '{:.1f}'.format(timing.peak / 1024)
+            print('--- {:<8}{:>12.6f}{:>12.6f}{:>12} ---'.format(
+                name, timing.wall, timing.cpu, peak))
+
+    @staticmethod
+    def get_memo_stats():
+        """Get the statistics of the memoized methods, that were called.
+
+        :return: list of tuples (name, hits, misses, evictions)
+        """
+        memo = sys.modules.get('challenges.memo')
+        if memo is None:
+            return []  # Not imported by the challenge, nothing memoized
+        return [(stat.name, stat.hits, stat.misses, stat.evictions)
+                for stat in memo.stats()]
+
+    def print_memo_stats(self, stats=None):
+        """Print the memo statistics, by default those of this process."""
+        if stats is None:
+            stats = self.get_memo_stats()
+        if not stats:
+            return
+        print('--- {:<28}{:>12}{:>12}{:>12} ---'.format(
+            'Memo', 'Hits', 'Misses', 'Evictions'))
+        for stat in stats:
+            print('--- {:<28}{:>12}{:>12}{:>12} ---'.format(*stat))
 
     def list_challenges(self):
         print(' * ' + '\n * '.join(self.conf.get_challenges()))
 
     def run_unittest(self):
+        import unittest
+        entry = self.conf.get_challenge_entry()
+        if entry is None or entry['unittest'] is None:
+            sys.exit('No unittest for ' + self.conf.get_challenge_name() + '.')
         c = self.conf.get_unittest()
         case = unittest.defaultTestLoader.loadTestsFromTestCase(c)
         unittest.TextTestRunner().run(case)
@@ -0,0 +1,92 @@
+"""Sequence comparison of challenges
+
+This module holds kernels to compare sequences position by position, like
+DNA strands read by `Challenge.fasta()`. Sequences may be given as str,
+bytes or NumPy arrays of uint8.
+
+The batch functions compare many reads against one reference at once. If
+NumPy is installed, the reads are stacked into one matrix and compared in
+bulk, else the comparison runs by C level iteration over bytes.
+"""
+
+from operator import eq, ne
+
+
+def match_count(first, second):
+    """Count the positions holding the same letter.
+
+    Compares up to the length of the shorter sequence.
+
+    :param first: sequence
+    :param second: sequence
+    :return: number of matching positions
+    """
+    return sum(map(eq, _to_bytes(first), _to_bytes(second)))
+
+
+def hamming(first, second):
+    """Get the Hamming distance of two sequences of equal length.
+
+    :param first: sequence
+    :param second: sequence
+    :return: number of differing positions
+    :raises ValueError: if the lengths differ
+    """
+    if len(first) != len(second):
+        raise ValueError('Sequences of different length.')
+    return sum(map(ne, _to_bytes(first), _to_bytes(second)))
+
+
+def match_counts(reference, reads):
+    """Count the matching positions of each read against a reference.
+
+    Each read is compared up to the length of the reference.
+
+    :param reference: sequence
+    :param reads: iterable of sequences
+    :return: list of numbers of matching positions
+    """
+    reference = _to_bytes(reference)
+    reads = [_to_bytes(read) for read in reads]
+    try:
+        import numpy
+    except ImportError:
+        return [sum(map(eq, reference, read)) for read in reads]
+    if not reads or not reference:
+        return [0] * len(reads)
+    length = len(reference)
+    matrix = numpy.frombuffer(
+        b''.join(read[:length].ljust(length, b'\0') for read in reads),
+        dtype=numpy.uint8).reshape(len(reads), length)
+    target = numpy.frombuffer(reference, dtype=numpy.uint8)
+    return (matrix == target).sum(axis=1).tolist()
+
+
+def best_match(reference, records):
+    """Get the id of the record matching the reference best.
+
+    Ties are won by the first record. If no record matches at any position,
+    None is returned.
+
+    :param reference: sequence
+    :param records: iterable of tuples (id, sequence), i.e. from fasta()
+    :return: id of the record with the most matching positions
+    """
+    names, reads = [], []
+    for name, read in records:
+        names.append(name)
+        reads.append(read)
+    winner, maximum = None, 0
+    for name, count in zip(names, match_counts(reference, reads)):
+        if count > maximum:
+            winner, maximum = name, count
+    return winner
+
+
+def _to_bytes(sequence):
+    """Convert a str or an array of uint8 to bytes."""
+    if isinstance(sequence, str):
+        return sequence.encode('ascii')
+    if isinstance(sequence, (bytes, bytearray)):
+        return sequence
+    return bytes(sequence)
@@ -0,0 +1,118 @@
+import importlib
+import json
+import os
+import socketserver
+import sys
+import time
+
+from challenges.compression import open_input
+from challenges.lines import MappedLines, StreamLines
+
+
+class Server:
+    """Keep a warm process to run challenges on request.
+
+    The server listens on a local Unix socket. A request is one line of
+    JSON, the response is one line of JSON, so that any client can talk to
+    it, i.e. the thin client `bin/challenge-client`.
+
+    Request::
+
+        {"challenge": "HelloWorld", "file": "/path/to/data.txt"}
+        {"challenge": "HelloWorld", "sample": "5\\nWorldHello"}
+
+    The optional key "mode" selects "stream" or "mmap" for files.
+
+    Response::
+
+        {"output": "...", "error": null, "seconds": 0.0001,
+         "timings": {"read": {"wall": 0.0, "cpu": 0.0, "peak": null}, ...}}
+
+    A challenge module is imported once and reloaded only if the
+    modification time of its file changed.
+    """
+
+    def __init__(self, conf):
+        self.conf = conf
+        self.mtimes = {}
+
+    def serve(self):
+        path = self.conf.get_socket_file()
+        if os.path.exists(path):
+            os.remove(path)  # Stale socket of a previous server
+        server = _UnixServer(path, _Handler)
+        server.owner = self
+        print('Serving on ' + path)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            os.remove(path)
+
+    def respond(self, request: dict):
+        """Run the challenge of the request.
+
+        :param request: dict of the request
+        :return: dict of the response
+        """
+        start = time.perf_counter()
+        challenge = None
+        try:
+            challenge = self.get_class(request['challenge'])()
+            if 'file' in request:
+                path = os.path.realpath(request['file'])
+                as_bytes = challenge.bytes_mode
+                if request.get('mode') == 'mmap':
+                    challenge.source = MappedLines(path, as_bytes=as_bytes)
+                elif request.get('mode') == 'stream':
+                    challenge.source = StreamLines(path, as_bytes=as_bytes)
+                else:
+                    with open_input(path) as pointer:
+                        challenge.sample = pointer.read()
+            elif 'sample' in request:
+                challenge.sample = request['sample']
+            challenge.main()
+        except Exception as error:
+            return {'output': None, 'error': repr(error), 'timings': {},
+                    'seconds': time.perf_counter() - start}
+        finally:
+            if challenge is not None and challenge.source is not None:
+                challenge.source.close()  # Not read to its end by all
+        timings = {name: vars(timing)
+                   for name, timing in challenge.timings.items()}
+        return {'output': challenge.output, 'error': None,
+                'timings': timings, 'seconds': time.perf_counter() - start}
+
+    def get_class(self, challenge: str):
+        """Import the challenge class, reload its module if it changed.
+
+        :param challenge: name of the challenge
+        :return: challenge class
+        """
+        name = challenge + '.challenge'
+        path = os.path.join(self.conf.root, challenge, 'challenge.py')
+        mtime = os.stat(path).st_mtime
+        module = sys.modules.get(name)
+        if module is None:
+            module = importlib.import_module(name)
+        elif self.mtimes.get(name) != mtime:
+            module = importlib.reload(module)
+        self.mtimes[name] = mtime
+        return getattr(module, challenge + 'Challenge')
+
+
+class _UnixServer(socketserver.UnixStreamServer):
+    owner = None
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline().decode('utf-8'))
+            response = self.server.owner.respond(request)
+        except ValueError as error:
+            response = {'output': None, 'error': repr(error), 'timings': {},
+                        'seconds': 0}
+        self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
@@ -0,0 +1,94 @@
+import io
+import sys
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from challenges.batch import init_worker
+from challenges.conf import Conf
+
+
+class Suite:
+    """Run the unittests of all challenges in a pool of processes.
+
+    Each test module of a challenge is one job. The reports of failing
+    tests are printed as collected, followed by the slowest tests and a
+    summary of all modules.
+    """
+
+    slowest = 10
+    """Number of the slowest tests to report."""
+
+    def __init__(self, conf):
+        self.conf = conf
+
+    def run(self):
+        manifest = self.conf.get_manifest()
+        names = [name + '.test.' + name + 'Test'
+                 for name in self.conf.get_challenges()
+                 if manifest.entries[name]['unittest'] is not None]
+        if not names:
+            sys.exit('No unittests found.')
+        start = time.perf_counter()
+        with ProcessPoolExecutor(self.conf.args.jobs, initializer=init_worker,
+                                 initargs=(self.conf.root,)) as executor:
+            results = list(executor.map(run_module, names))
+        self.print_summary(results, time.perf_counter() - start)
+        if not all(result['successful'] for result in results):
+            sys.exit(1)
+
+    def print_summary(self, results, total):
+        timings = []
+        for result in results:
+            if not result['successful']:
+                print(result['report'])
+            timings += result['timings']
+        timings.sort(key=lambda timing: timing[1], reverse=True)
+        print('--- {:<60}{:>12} ---'.format('Slowest tests', 'seconds'))
+        for test, seconds in timings[:self.slowest]:
+            print('--- {:<60}{:>12.4f} ---'.format(test, seconds))
+        failed = [result['name'] for result in results
+                  if not result['successful']]
+        print('Ran {} tests of {} challenges in {:.3f}s'.format(
+            sum(result['tests'] for result in results), len(results), total))
+        if failed:
+            print('FAILED: ' + ', '.join(failed))
+        else:
+            print('OK')
+
+
+class _TimedResult(unittest.TextTestResult):
+    """Text test result, that records the time of each test."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.timings = []
+        self.started = None
+
+    def startTest(self, test):
+        self.started = time.perf_counter()
+        super().startTest(test)
+
+    def stopTest(self, test):
+        super().stopTest(test)
+        self.timings.append((test.id(), time.perf_counter() - self.started))
+
+
+def run_module(name):
+    """Run the test case of one challenge.
+
+    :param name: full qualified name of the test case class
+    :return: dict with the keys name, tests, successful, timings and report
+    """
+    stream = io.StringIO()
+    runner = unittest.TextTestRunner(stream, resultclass=_TimedResult)
+    try:
+        case = unittest.defaultTestLoader.loadTestsFromTestCase(
+            Conf.get_class(name))
+    except Exception as error:
+        return {'name': name, 'tests': 0, 'successful': False,
+                'timings': [], 'report': name + ': ' + repr(error)}
+    result = runner.run(case)
+    return {'name': name, 'tests': result.testsRun,
+            'successful': result.wasSuccessful(), 'timings': result.timings,
+            'report': stream.getvalue()}
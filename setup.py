@@ -33,6 +33,10 @@ setup(
         'challenges': ['version.txt'],
     },
     include_package_data=True,
+    extras_require={
+        'numpy': ['numpy'],
+        'zstandard': ['zstandard'],
+    },
     entry_points={
         'console_scripts': [
             'challenge=challenges:main',
@@ -40,7 +44,7 @@ setup(
             'rosalind=challenges:main',
         ],
     },
-    scripts=['bin/challenge'],
+    scripts=['bin/challenge', 'bin/challenge-client'],
     classifiers=[
         'Development Status :: 4 - Beta',
         'Environment :: Console',
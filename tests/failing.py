@@ -0,0 +1,15 @@
+"""Test case run by the worker in tests of the suite.
+
+Its name doesn't match test*.py, so it isn't collected itself.
+"""
+
+import unittest
+
+
+class Failing(unittest.TestCase):
+
+    def test_pass(self):
+        pass
+
+    def test_fail(self):
+        self.fail('on purpose')
@@ -0,0 +1,88 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from challenges.batch import get_inputs, get_output_file, run_file
+from challenges.lines import StreamLines
+
+
+class BatchTestCase(unittest.TestCase):
+
+    """Test cases of the batch worker."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'data.txt')
+        with open(self.path, 'w') as pointer:
+            pointer.write('5\nWorldHello\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_get_output_file(self):
+        """Show the output is written next to the input."""
+        self.assertEqual('/in/data.result.txt',
+                         get_output_file('/in/data.txt'))
+        self.assertEqual('/in/data.dat.result.txt',
+                         get_output_file('/in/data.dat'))
+
+    def test_get_inputs(self):
+        """Show outputs are skipped and colliding inputs are refused."""
+        other = os.path.join(self.directory, 'data.dat')
+        output = get_output_file(self.path)
+        self.assertEqual([self.path, other],
+                         get_inputs([self.path, output, other, self.path]))
+        with self.assertRaises(ValueError):
+            get_inputs([self.path, os.path.join(self.directory, 'data')])
+
+    def test_run_file(self):
+        """Show a file is run and its output is written."""
+        path, output, seconds, error = run_file(
+            'HelloWorld.challenge.HelloWorldChallenge', self.path, 'stream')
+        self.assertIsNone(error)
+        with open(output) as pointer:
+            self.assertEqual('Hello World\n11', pointer.read())
+
+    def test_run_file_in_bytes_mode(self):
+        """Show the bytes mode reaches the challenge of each mode."""
+        name = 'HelloWorld.challenge.HelloWorldChallenge'
+        for mode in (None, 'stream', 'mmap'):
+            with mock.patch(name + '.format', lambda challenge: setattr(
+                    challenge, 'output', repr(challenge.line(1)))), \
+                    mock.patch(name + '.calc', lambda challenge: None):
+                *_, output, _, error = run_file(name, self.path, mode,
+                                                bytes_mode=True)
+            self.assertIsNone(error)
+            with open(output) as pointer:
+                self.assertEqual("b'WorldHello'", pointer.read())
+
+    def test_run_file_closes_source(self):
+        """Show a source is closed, even if not read to its end."""
+        name = 'HelloWorld.challenge.HelloWorldChallenge'
+        close = StreamLines.close
+        with mock.patch.object(StreamLines, 'close', autospec=True,
+                               side_effect=close) as closed:
+            *_, error = run_file(name, self.path, 'stream')
+        self.assertIsNone(error)
+        closed.assert_called()
+
+    def test_run_file_reports_errors(self):
+        """Show a failing file is reported instead of raising."""
+        *_, error = run_file('HelloWorld.challenge.Missing', self.path)
+        self.assertIn('AttributeError', error)
+
+    def test_run_file_with_limits(self):
+        """Show a guarded file is run and a hanging one is stopped."""
+        name = 'HelloWorld.challenge.HelloWorldChallenge'
+        *_, error = run_file(name, self.path, timeout=10, memory=1024)
+        self.assertIsNone(error)
+        with mock.patch('HelloWorld.challenge.HelloWorldChallenge.calc',
+                        lambda challenge: time.sleep(10)):
+            path, output, seconds, error = run_file(name, self.path,
+                                                    timeout=0.5)
+        self.assertEqual('Timeout of 0.5 s exceeded in phase calc', error)
+        self.assertEqual(['data.result.txt', 'data.txt'],
+                         sorted(os.listdir(self.directory)))
@@ -0,0 +1,51 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from types import SimpleNamespace as namespace
+
+from challenges import Challenge
+from challenges.bench import Bench
+
+
+class BenchTestCase(unittest.TestCase):
+
+    """Test cases of the benchmark of challenges."""
+
+    def test_fit_exponent(self):
+        """Show the exponent of the complexity is fitted."""
+        linear = [(n, 2 * n) for n in (10, 100, 1000)]
+        self.assertAlmostEqual(1.0, Bench.fit_exponent(linear))
+        quadratic = [(n, n * n) for n in (10, 100, 1000)]
+        self.assertAlmostEqual(2.0, Bench.fit_exponent(quadratic))
+        self.assertIsNone(Bench.fit_exponent([(10, 1.0)]))
+
+    def test_measure(self):
+        """Show a new instance of the challenge is run on the sample."""
+        self.assertGreaterEqual(Bench.measure(Challenge, 'sample'), 0)
+
+    def test_generate_is_optional(self):
+        """Show the base class doesn't generate inputs."""
+        with self.assertRaises(NotImplementedError):
+            Challenge.generate(10)
+
+    def test_add_to_store(self):
+        """Show results are stored by revision and size."""
+        store = {}
+        Bench.add_to_store(store, 'abc', [(10, 1.0, 2.0)], 3)
+        Bench.add_to_store(store, 'abc', [(20, 3.0, 4.0)], 3)
+        self.assertEqual({'10', '20'}, set(store['abc']['sizes']))
+        self.assertEqual({'best': 3.0, 'mean': 4.0, 'repeat': 3},
+                         store['abc']['sizes']['20'])
+
+    def test_compare_flags_regressions(self):
+        """Show a slowdown beyond the threshold is a regression."""
+        args = namespace(bench_compare='', threshold=0.1)
+        bench = Bench(namespace(args=args))
+        store = {}
+        Bench.add_to_store(store, 'old', [(10, 1.0, 1.0)], 1)
+        Bench.add_to_store(store, 'new', [(10, 1.05, 1.05)], 1)
+        with redirect_stdout(io.StringIO()) as out:
+            self.assertFalse(bench.compare(store, 'new', [(10, 1.05, 1.05)]))
+            self.assertTrue(bench.compare(store, 'new', [(10, 1.2, 1.2)]))
+        self.assertIn('Compare new with old', out.getvalue())
+        self.assertIn('REGRESSION', out.getvalue())
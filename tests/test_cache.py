@@ -0,0 +1,87 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from challenges.cache import ResultCache
+
+
+class ResultCacheTestCase(unittest.TestCase):
+
+    """Test cases of the content addressed result cache."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.directory = os.path.join(self.root, 'cache')
+        self.module = os.path.join(self.root, 'challenge.py')
+        self.write(self.module, 'class Challenge: pass\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    @staticmethod
+    def write(path, text):
+        with open(path, 'w') as pointer:
+            pointer.write(text)
+
+    def test_key_depends_on_source_input_and_version(self):
+        """Show each of version, source, input and mode changes the key."""
+        key = ResultCache.key('1.0', self.module, sample='1 2')
+        self.assertEqual(key, ResultCache.key('1.0', self.module,
+                                              sample='1 2'))
+        self.assertNotEqual(key, ResultCache.key('1.0', self.module,
+                                                 sample='1 3'))
+        self.assertNotEqual(key, ResultCache.key('1.1', self.module,
+                                                 sample='1 2'))
+        self.assertNotEqual(key, ResultCache.key('1.0', self.module,
+                                                 sample='1 2',
+                                                 bytes_mode=True))
+        self.write(self.module, 'class Challenge: x = 1\n')
+        self.assertNotEqual(key, ResultCache.key('1.0', self.module,
+                                                 sample='1 2'))
+
+    def test_key_of_sample_is_hashed_in_chunks(self):
+        """Show a sample longer than a chunk is hashed by its content."""
+        sample = 'ä' * (ResultCache.chunk_size + 3)
+        bytes_sample = sample.encode('utf-8')
+        self.assertEqual(ResultCache.key('1.0', self.module, sample=sample),
+                         ResultCache.key('1.0', self.module,
+                                         sample=bytes_sample))
+
+    def test_key_of_file_depends_on_size_and_time(self):
+        """Show a lazily read file is keyed by its status, not content."""
+        path = os.path.join(self.root, 'data.txt')
+        self.write(path, '1 2')
+        os.utime(path, (1, 1))
+        key = ResultCache.key('1.0', self.module, input_file=path)
+        self.write(path, '1 3')
+        os.utime(path, (1, 1))
+        self.assertEqual(key, ResultCache.key('1.0', self.module,
+                                              input_file=path))
+        os.utime(path, (2, 2))
+        self.assertNotEqual(key, ResultCache.key('1.0', self.module,
+                                                 input_file=path))
+        self.write(path, '1 23')
+        os.utime(path, (1, 1))
+        self.assertNotEqual(key, ResultCache.key('1.0', self.module,
+                                                 input_file=path))
+
+    def test_get_returns_stored_output(self):
+        """Show a stored output is returned, a missing one is None."""
+        cache = ResultCache(self.directory, 1024)
+        self.assertIsNone(cache.get('ab12'))
+        cache.put('ab12', 'result')
+        self.assertEqual('result', cache.get('ab12'))
+
+    def test_least_recently_used_is_evicted(self):
+        """Show outputs beyond the size limit are evicted oldest first."""
+        cache = ResultCache(self.directory, 20)
+        cache.put('aa01', 'x' * 10)
+        os.utime(cache.path('aa01'), (1, 1))
+        cache.put('bb02', 'y' * 10)
+        os.utime(cache.path('bb02'), (2, 2))
+        cache.get('aa01')  # Now the most recently used
+        cache.put('cc03', 'z' * 10)
+        self.assertEqual('x' * 10, cache.get('aa01'))
+        self.assertIsNone(cache.get('bb02'))
+        self.assertEqual('z' * 10, cache.get('cc03'))
@@ -1,8 +1,15 @@
+import io
+import re
 import unittest
 
 from types import SimpleNamespace as namespace
 
-from challenges import Challenge
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from challenges import Challenge, Edge
 
 
 class ChallengeTestCase(unittest.TestCase):
@@ -27,6 +34,107 @@ class ChallengeTestCase(unittest.TestCase):
         self.assertIsInstance(self.challenge.result, namespace)
         self.assertEqual(self.challenge.output, '')
 
+    def test_patterns_are_compiled_per_class(self):
+        """Show the pattern registry is built when a subclass is defined."""
+        class Colons(Challenge):
+            split_pattern = ':'
+        self.assertEqual(':', Colons._patterns['split_pattern'].pattern)
+        self.assertEqual(Challenge.split_pattern,
+                         Challenge._patterns['split_pattern'].pattern)
+        self.assertIs(Challenge._patterns['edge_pattern'],
+                      self.challenge.compiled_pattern('edge_pattern'))
+
+    def test_str_only_pattern(self):
+        """Show a pattern invalid for bytes is fine without bytes mode."""
+        class Spaces(Challenge):
+            split_pattern = r'\N{SPACE}+'
+        challenge = Spaces()
+        challenge.lines = ['1  2 3']
+        self.assertEqual([1, 2, 3], challenge.line_to_integers(0))
+        self.assertEqual({}, Spaces._bytes_patterns)
+        challenge.bytes_mode = True
+        with self.assertRaises(re.error):
+            challenge.compiled_pattern('split_pattern')
+        challenge.split_pattern = '[äö]'
+        with self.assertRaises(UnicodeEncodeError):
+            challenge.compiled_pattern('split_pattern')
+
+    def test_bytes_pattern_is_registered_on_first_use(self):
+        """Show a bytes pattern is compiled once for the class."""
+        class Colons(Challenge):
+            split_pattern = ':'
+        compiled = Colons().compiled_pattern('split_pattern', as_bytes=True)
+        self.assertEqual(b':', compiled.pattern)
+        self.assertIs(compiled, Colons().compiled_pattern(
+            'split_pattern', as_bytes=True))
+
+    def test_compiled_pattern_follows_instance_override(self):
+        """Show a pattern changed on the instance is compiled again."""
+        self.challenge.split_pattern = ';'
+        self.challenge.lines = ['1;2;3']
+        self.assertEqual([1, 2, 3], self.challenge.line_to_integers(0))
+        self.assertEqual(Challenge.split_pattern,
+                         Challenge._patterns['split_pattern'].pattern)
+
+    def test_bytes_mode(self):
+        """Show the parsing helpers work on lines of bytes."""
+        self.challenge.bytes_mode = True
+        self.challenge.sample = '''
+            1, 2 3
+            >Rosalind_1
+            ACGT
+            1->2:5
+            (+1 -2)(+3)
+            (+1 -2)
+        '''
+        self.challenge.read()
+        self.assertEqual(b'1, 2 3', self.challenge.line(0))
+        self.assertEqual([1, 2, 3], self.challenge.line_to_integers(0))
+        self.assertEqual([1.0, 2.0, 3.0], self.challenge.line_to_floats(0))
+        self.assertEqual([[b'1', b'2', b'3']],
+                         self.challenge.lines_to_words(0, 1))
+        self.assertEqual([(b'Rosalind_1', b'ACGT')],
+                         list(self.challenge.fasta(1, 3)))
+        self.assertEqual([(b'Rosalind_1', 'ACGT')],
+                         list(self.challenge.fasta(1, 3, as_bytes=False)))
+        self.assertEqual([Edge(1, 2, 5)], self.challenge.line_to_edges(3))
+        self.assertEqual([(1, -2), (3,)],
+                         self.challenge.line_to_permutations(4))
+        self.assertEqual((1, -2), self.challenge.line_to_permutation(5))
+        self.assertEqual([[1, 2, 3]],
+                         list(map(list, self.challenge.lines_to_array(
+                             0, 1, dtype=int))))
+        self.assertIsInstance(
+            self.challenge.compiled_pattern('split_pattern').pattern, bytes)
+        self.assertIsInstance(self.challenge.compiled_pattern(
+            'split_pattern', as_bytes=False).pattern, str)
+
+    def test_read_normalises_sample(self):
+        """Show read() normalises the sample like example() does."""
+        self.challenge.sample = '''
+
+            1 2
+              3
+
+            4
+
+        '''
+        self.challenge.read()
+        self.assertEqual(['1 2', '3', '', '4'], self.challenge.lines)
+        self.assertEqual('\n'.join(self.challenge.lines),
+                         self.challenge.example())
+
+    def test_read_uses_reimplemented_example(self):
+        """Show a reimplemented example() is still used by read()."""
+        class Upper(Challenge):
+            sample = 'a\nb'
+
+            def example(self):
+                return self.sample.upper()
+        challenge = Upper()
+        challenge.read()
+        self.assertEqual(['A', 'B'], challenge.lines)
+
     def test_instance_shadows_class_attribute_of_sample(self):
         """ Show that instance attribute shadows class attribute."""
         self.assertIn('sample', Challenge.sample)
@@ -49,6 +157,34 @@ class ChallengeTestCase(unittest.TestCase):
         self.challenge.read()
         self.assertEqual(self.challenge.lines, ['one', 'two'])
 
+    def test_main_records_timings(self):
+        """Show that main records the timings of each phase."""
+        self.challenge.main()
+        self.assertEqual(['read', 'build', 'calc', 'format'],
+                         list(self.challenge.timings))
+        timing = self.challenge.timings['calc']
+        self.assertGreaterEqual(timing.wall, 0)
+        self.assertGreaterEqual(timing.cpu, 0)
+        self.assertIsNone(timing.peak)
+        self.assertIsNone(self.challenge.phase)
+
+    def test_main_traces_memory(self):
+        """Show that main traces the peak memory on request."""
+        self.challenge.trace_memory = True
+        self.challenge.main()
+        self.assertGreater(self.challenge.timings['read'].peak, 0)
+
+    def test_main_profiles_phases(self):
+        """Show that an injected profiler runs during the selected phases."""
+        import cProfile
+        import pstats
+        self.challenge.profiler = cProfile.Profile()
+        self.challenge.main()
+        functions = [function for _, _, function in
+                     pstats.Stats(self.challenge.profiler).stats]
+        self.assertIn('calc', functions)
+        self.assertNotIn('read', functions)
+
     def test_build(self):
         """Show that build is callable."""
         self.challenge.build()
@@ -66,6 +202,28 @@ class ChallengeTestCase(unittest.TestCase):
         self.assertIsInstance(self.challenge.output, str)
         self.assertEqual(self.challenge.output, '2')
 
+    def test_format_stream(self):
+        """Show the output of format is written by default."""
+        self.challenge.result = 2
+        writer = io.StringIO()
+        self.challenge.format_stream(writer)
+        self.assertEqual('2', writer.getvalue())
+
+    def test_main_with_writer(self):
+        """Show chunks of format_stream go to the writer or to output."""
+        class Chunks(Challenge):
+            def format_stream(self, writer):
+                for chunk in ('1', '2', '3'):
+                    writer.write(chunk)
+        challenge = Chunks()
+        writer = io.StringIO()
+        challenge.main(writer)
+        self.assertEqual('123', writer.getvalue())
+        self.assertEqual('', challenge.output)
+        self.assertIn('format', challenge.timings)
+        challenge.main()
+        self.assertEqual('123', challenge.output)
+
     def test_line(self):
         """ Show that a line is retrievable by index."""
         self.challenge.lines = ['one', 'two', 'three']
@@ -79,6 +237,25 @@ class ChallengeTestCase(unittest.TestCase):
         expect = ['two', 'three']
         self.assertEqual(expect, self.challenge.lines_to_list(1, 3) )
 
+    def test_iter_lines(self):
+        """ Show that iter_lines() works like lines_to_list(). """
+        self.challenge.lines = ['one', 'two', 'three', 'foor']
+        self.assertEqual(['one', 'two', 'three', 'foor'],
+                         list(self.challenge.iter_lines()))
+        self.assertEqual(['two', 'three'],
+                         list(self.challenge.iter_lines(1, 3)))
+
+    def test_negative_range(self):
+        """ Show that negative bounds count from the end like slices. """
+        self.challenge.lines = ['1 2', '3 4', '5 6']
+        self.assertEqual(['3 4'], list(self.challenge.iter_lines(1, -1)))
+        self.assertEqual([[1, 2], [3, 4]],
+                         self.challenge.lines_to_integers(0, -1))
+        self.assertEqual([['3', '4'], ['5', '6']],
+                         self.challenge.lines_to_words(-2))
+        self.challenge.lines = ('1 2', '3 4', '5 6')  # Not a list
+        self.assertEqual([[3, 4]], self.challenge.lines_to_integers(1, -1))
+
     def test_line_to_words(self):
         """ Show that line_to_words() works as expected. """
         self.challenge.lines = ['one two', 'three four']
@@ -129,6 +306,42 @@ class ChallengeTestCase(unittest.TestCase):
                          self.challenge.lines_to_floats(flatten=True))
         self.assertEqual([[3.3, 4.4]], self.challenge.lines_to_floats(1,2))
 
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_lines_to_array(self):
+        """Show lines_to_array() parses lines in bulk into an array."""
+        self.challenge.lines = ['one', '1 2', '3, 4', '5 6']
+        array = self.challenge.lines_to_array(1, dtype=int)
+        self.assertIsInstance(array, numpy.ndarray)
+        self.assertEqual((3, 2), array.shape)
+        self.assertEqual([[1, 2], [3, 4], [5, 6]], array.tolist())
+        array = self.challenge.lines_to_array(1, 3, flatten=True)
+        self.assertEqual([1.0, 2.0, 3.0, 4.0], array.tolist())
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_lines_to_array_with_split_pattern(self):
+        """Show lines_to_array() respects an adjusted split pattern."""
+        self.challenge.split_pattern = ':'
+        self.challenge.lines = ['1:2', '3:4']
+        array = self.challenge.lines_to_array(dtype='int64')
+        self.assertEqual([[1, 2], [3, 4]], array.tolist())
+
+    def test_lines_to_array_falls_back_to_lists(self):
+        """Show lines_to_array() falls back to lists for ragged rows."""
+        self.challenge.lines = ['1 2', '3']
+        self.assertEqual([[1, 2], [3]],
+                         self.challenge.lines_to_array(dtype=int))
+        self.assertEqual([1.0, 2.0, 3.0],
+                         self.challenge.lines_to_array(flatten=True))
+
+    def test_lines_to_array_keeps_empty_and_comment_lines(self):
+        """Show empty lines and hashes raise like the list helpers do."""
+        for lines in (['1 2', '', '3 4'], ['1 2', '#5 6']):
+            self.challenge.lines = lines
+            with self.assertRaises(ValueError):
+                self.challenge.lines_to_integers()
+            with self.assertRaises(ValueError):
+                self.challenge.lines_to_array(dtype=int)
+
     def test_line_to_permuation(self):
         """Show a line can be retrieved as permutation."""
         self.challenge.lines = ['one', '+1 -2']
@@ -157,35 +370,35 @@ class ChallengeTestCase(unittest.TestCase):
     def test_line_to_edge(self):
         """Show lint_to_edge() works as expected."""
         self.challenge.lines = ['one', '1->2:12']
-        self.assertEqual(namespace(head=2, tail=1, weight=12),
+        self.assertEqual(Edge(1, 2, 12),
                          self.challenge.line_to_edge(1))
         self.challenge.lines = ['one', '1->2']
-        self.assertEqual(namespace(head=2, tail=1),
+        self.assertEqual(Edge(1, 2),
                          self.challenge.line_to_edge(1))
 
     def test_line_to_edges(self):
         """Show lint_to_edges() works as expected."""
         self.challenge.lines = ['one', '1->2, 3']
-        self.assertEqual([namespace(head='2', tail=1),
-                          namespace(head='3', tail=1)],
+        self.assertEqual([Edge(1, 2),
+                          Edge(1, 3)],
                          self.challenge.line_to_edges(1))
 
     def test_lines_to_edges(self):
         """Show lines_to_edges() works as expected."""
         self.challenge.lines = ['1->2', '2->3', '3->4']
-        expect = [namespace(head=2, tail=1),
-                  namespace(head=3, tail=2),
-                  namespace(head=4, tail=3)]
+        expect = [Edge(1, 2),
+                  Edge(2, 3),
+                  Edge(3, 4)]
         self.assertEqual(expect, self.challenge.lines_to_edges())
-        expect = [namespace(head=3, tail=2)]
+        expect = [Edge(2, 3)]
         self.assertEqual(expect, self.challenge.lines_to_edges(1,2))
         self.challenge.lines = ['1->2:22']
-        expect = [namespace(head=2, tail=1, weight=22)]
+        expect = [Edge(1, 2, 22)]
         self.assertEqual(expect, self.challenge.lines_to_edges())
         self.challenge.lines = ['1->2, 3', '2->3']
-        expect = [namespace(head='2', tail=1),
-                  namespace(head='3', tail=1),
-                  namespace(head=3, tail=2)]
+        expect = [Edge(1, 2),
+                  Edge(1, 3),
+                  Edge(2, 3)]
         self.assertEqual(expect, self.challenge.lines_to_edges())
 
     def test_lines_to_graph(self):
@@ -204,6 +417,9 @@ class ChallengeTestCase(unittest.TestCase):
         self.challenge.lines = ['1->2:3']
         graph = self.challenge.lines_to_graph()
         self.assertEqual(3, graph.weights[(1, 2)])
+        self.challenge.lines = ['1->2']
+        graph = self.challenge.lines_to_graph()
+        self.assertEqual({}, graph.weights)
 
 
     def test_read_edges_from_to(self):
@@ -220,7 +436,7 @@ class ChallengeTestCase(unittest.TestCase):
         self.challenge.read()
         result = self.challenge.edges(start=2, stop=4)
         self.assertEqual(result.__name__, 'edges')
-        self.assertEqual(len(list(result)), 2)
+        self.assertEqual([Edge(2, 9), Edge(3, 9)], list(result))
 
     def test_read_edges_from(self):
         """Show reading edges self limiting."""
@@ -397,3 +613,21 @@ class ChallengeTestCase(unittest.TestCase):
         )
         expect = '(+1-2)(-3+4)'
         self.assertEqual(expect, actual)
+
+    def test_write_joined(self):
+        """Show strings are joined across chunks."""
+        for count in (0, 1, 3, 4, 7):
+            writer = io.StringIO()
+            strings = [str(i) for i in range(count)]
+            self.challenge.write_joined(writer, iter(strings), ', ',
+                                        chunk_size=3)
+            self.assertEqual(', '.join(strings), writer.getvalue())
+
+    def test_write_list_of_integers_and_permutations(self):
+        """Show the written output equals the formatted output."""
+        writer = io.StringIO()
+        self.challenge.write_list_of_integers(writer, range(3))
+        self.assertEqual('0, 1, 2', writer.getvalue())
+        writer = io.StringIO()
+        self.challenge.write_permutations(writer, [[1, -2], [-3, 4]])
+        self.assertEqual('(+1 -2)\n(-3 +4)', writer.getvalue())
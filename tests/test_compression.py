@@ -0,0 +1,94 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from challenges.compression import TextReader, detect, open_compressed, \
+    open_input
+from challenges.lines import MappedLines, StreamLines
+
+
+class CompressionTestCase(unittest.TestCase):
+
+    """Test cases of the transparent decompression of input files."""
+
+    text = '\n1 2\n3 4\n\n'
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, suffix):
+        path = os.path.join(self.directory, 'data')  # No telling suffix
+        with open_compressed(path, suffix, 'w') as pointer:
+            pointer.write(self.text)
+        return path
+
+    def assert_round_trip(self, suffix):
+        path = self.write(suffix)
+        self.assertEqual(suffix, detect(path))
+        with open_input(path) as pointer:
+            self.assertEqual(self.text, pointer.read())
+
+    def test_plain_text(self):
+        """Show plain text is not detected as compressed."""
+        self.assert_round_trip(None)
+
+    def test_plain_text_like_magic_bytes(self):
+        """Show plain text starting like a bzip2 header is plain."""
+        self.text = 'BZh is not bzip2\n'
+        self.assert_round_trip(None)
+        self.text = ''
+        self.assert_round_trip('bz2')  # Empty stream
+
+    def test_standard_formats(self):
+        """Show gzip, bzip2 and xz are detected and decompressed."""
+        for suffix in ('gz', 'bz2', 'xz'):
+            self.assert_round_trip(suffix)
+
+    @unittest.skipIf(zstandard is None, 'zstandard is not installed')
+    def test_zstandard(self):
+        """Show zstandard is detected and decompressed."""
+        self.assert_round_trip('zst')
+
+    def test_lines_split_like_plain_file(self):
+        """Show a form feed splits a line neither plain nor compressed."""
+        self.text = '1\x0c2\r\n3\x1c4\n'
+        for suffix in (None, 'gz'):
+            lines = StreamLines(self.write(suffix))
+            self.assertEqual(['1\x0c2', '3\x1c4'], list(lines))
+            lines.close()
+
+    def test_stream_lines_of_compressed_file(self):
+        """Show lines are streamed from a compressed file."""
+        lines = StreamLines(self.write('gz'))
+        self.assertEqual(['1 2', '3 4'], list(lines))
+        lines.close()
+
+    def test_compressed_file_is_not_mapped(self):
+        """Show a compressed file can't be memory mapped."""
+        with self.assertRaises(ValueError):
+            MappedLines(self.write('xz'))
+
+    def test_text_reader_across_chunks(self):
+        """Show lines and characters split between chunks are joined."""
+        data = 'ä1\r\n22\n\n333'.encode('utf-8')
+        for size in range(1, len(data) + 1):
+            reader = TextReader(io.BytesIO(data))
+            reader.chunk_size = size
+            self.assertEqual(['ä1\r\n', '22\n', '\n', '333'], list(reader))
+        reader = TextReader(io.BytesIO(data))
+        self.assertEqual('ä1\r\n', next(reader))
+        self.assertEqual('22\n\n333', reader.read())
+        reader = TextReader(io.BytesIO(data))
+        self.assertEqual('ä', reader.read(1))
+        reader = TextReader(io.BytesIO(data), None)
+        self.assertEqual(data.splitlines(True), list(reader))
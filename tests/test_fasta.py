@@ -0,0 +1,166 @@
+import gzip
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from challenges import Challenge
+from challenges.fasta import FastaIndex, open_fasta, parse_fasta, read_fasta
+from challenges.lines import StreamLines
+
+FASTA = b'''>FAS_1
+AAA
+CCC
+
+>FAS_2
+GGG
+TT
+'''
+
+
+class FastaTestCase(unittest.TestCase):
+
+    """Test cases of the FASTA parser."""
+
+    def test_parse_str_lines(self):
+        """Show records are parsed from str lines."""
+        lines = ['>FAS_1', 'AAA', 'CCC', '>FAS_2', 'GGG', '14']
+        self.assertEqual([('FAS_1', 'AAACCC'), ('FAS_2', 'GGG')],
+                         list(parse_fasta(lines)))
+
+    def test_parse_bytes_lines(self):
+        """Show records are parsed from bytes lines."""
+        lines = [b'>FAS_1', b'AAA', b'CCC']
+        self.assertEqual([('FAS_1', 'AAACCC')], list(parse_fasta(lines)))
+        self.assertEqual([('FAS_1', b'AAACCC')],
+                         list(parse_fasta(lines, as_bytes=True)))
+        self.assertEqual([(b'FAS_1', b'AAACCC')],
+                         list(parse_fasta(lines, as_bytes=True,
+                                          ids_as_bytes=True)))
+
+    def test_parse_with_compiled_pattern(self):
+        """Show a compiled str pattern is adapted to bytes lines."""
+        challenge = Challenge()
+        pattern = challenge.compiled_pattern('fasta_pattern')
+        self.assertEqual([('X', 'AC')],
+                         list(parse_fasta([b'>X', b'AC'], pattern)))
+
+    def test_read_stream(self):
+        """Show records are read from a binary stream."""
+        records = list(read_fasta(io.BytesIO(FASTA), as_bytes=True))
+        self.assertEqual([('FAS_1', b'AAACCC'), ('FAS_2', b'GGGTT')],
+                         records)
+
+    def test_open_file(self):
+        """Show records are read from a memory mapped file."""
+        handle, path = tempfile.mkstemp()
+        with os.fdopen(handle, 'wb') as pointer:
+            pointer.write(FASTA)
+        try:
+            self.assertEqual([('FAS_1', 'AAACCC'), ('FAS_2', 'GGGTT')],
+                             list(open_fasta(path)))
+            challenge = Challenge()
+            self.assertEqual({'FAS_1': b'AAACCC', 'FAS_2': b'GGGTT'},
+                             dict(challenge.fasta_file(path, as_bytes=True)))
+            challenge.bytes_mode = True
+            self.assertEqual({b'FAS_1': b'AAACCC', b'FAS_2': b'GGGTT'},
+                             dict(challenge.fasta_file(path)))
+            self.assertEqual(b'GGGTT', challenge.fasta_record(b'FAS_2', path))
+            challenge._fasta_index.close()
+        finally:
+            os.remove(path)
+            if os.path.exists(path + FastaIndex.suffix):
+                os.remove(path + FastaIndex.suffix)
+
+    def test_challenge_fasta_as_bytes(self):
+        """Show the challenge yields sequences as bytes on request."""
+        challenge = Challenge()
+        challenge.lines = ['0', '>FAS_1', 'AAA', 'CCC']
+        self.assertEqual([b'AAACCC'],
+                         challenge.fasta_strands(1, as_bytes=True))
+
+    def test_challenge_fasta_in_bytes_mode(self):
+        """Show ids and sequences are bytes in bytes mode."""
+        challenge = Challenge()
+        challenge.bytes_mode = True
+        challenge.lines = [b'>FAS_1', b'AAA', b'>FAS_2', b'CC']
+        self.assertEqual([(b'FAS_1', b'AAA'), (b'FAS_2', b'CC')],
+                         list(challenge.fasta()))
+        self.assertEqual(b'CC', challenge.fasta_record(b'FAS_2'))
+        self.assertEqual(b'CC', challenge.fasta_record('FAS_2'))
+
+
+    def test_compressed_source(self):
+        """Show a compressed source is parsed by its lines, not mapped."""
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'data.fa.gz')
+        with gzip.open(path, 'wb') as pointer:
+            pointer.write(FASTA)
+        challenge = Challenge()
+        challenge.source = StreamLines(path)
+        try:
+            challenge.read()
+            self.assertEqual([('FAS_1', 'AAACCC'), ('FAS_2', 'GGGTT')],
+                             list(challenge.fasta_file()))
+            self.assertEqual('GGGTT', challenge.fasta_record('FAS_2'))
+            with self.assertRaises(ValueError):
+                list(challenge.fasta_file(path))
+            with self.assertRaises(ValueError):
+                challenge.fasta_record('FAS_2', path)
+            self.assertEqual(['data.fa.gz'], os.listdir(directory))
+        finally:
+            challenge.source.close()
+            shutil.rmtree(directory)
+
+
+class FastaIndexTestCase(unittest.TestCase):
+
+    """Test cases of the indexed random access to FASTA files."""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        with os.fdopen(handle, 'wb') as pointer:
+            pointer.write(b'>FAS_1\nAAAA\nCCCC\nGG\n'
+                          b'>FAS_2\nTTT\n\nTTTTT\n'
+                          b'>FAS_3\n')
+
+    def tearDown(self):
+        for path in (self.path, self.path + FastaIndex.suffix):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_build(self):
+        """Show entries are collected like samtools faidx does."""
+        index = FastaIndex.build(self.path)
+        self.assertEqual(['FAS_1', 'FAS_2', 'FAS_3'], index.ids)
+        self.assertEqual((10, 7, 4, 5), index.entries['FAS_1'])
+        self.assertEqual((8, 27, 8, 11), index.entries['FAS_2'])
+        self.assertEqual(3, len(index))
+        self.assertIn('FAS_3', index)
+
+    def test_fetch(self):
+        """Show records are fetched by id and by position."""
+        index = FastaIndex.build(self.path)
+        self.assertEqual('AAAACCCCGG', index.fetch('FAS_1'))
+        self.assertEqual(b'TTTTTTTT', index.fetch('FAS_2', as_bytes=True))
+        self.assertEqual(('FAS_3', ''), index.fetch_at(2))
+        index.close()
+
+    def test_load_writes_and_reads_sidecar(self):
+        """Show the sidecar is written once and loaded later on."""
+        index = FastaIndex.load(self.path)
+        self.assertTrue(os.path.exists(self.path + FastaIndex.suffix))
+        loaded = FastaIndex.load(self.path)
+        self.assertEqual(index.entries, loaded.entries)
+        self.assertEqual(index.ids, loaded.ids)
+
+    def test_challenge_fasta_record(self):
+        """Show a challenge fetches a record by id."""
+        challenge = Challenge()
+        self.assertEqual('AAAACCCCGG',
+                         challenge.fasta_record('FAS_1', self.path))
+        challenge.lines = ['>FAS_1', 'AAA', '>FAS_2', 'CCC']
+        self.assertEqual('CCC', challenge.fasta_record('FAS_2'))
+        with self.assertRaises(KeyError):
+            challenge.fasta_record('FAS_3')
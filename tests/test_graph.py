@@ -0,0 +1,50 @@
+import unittest
+
+from challenges import Challenge
+from challenges.graph import CsrGraph
+
+
+class CsrGraphTestCase(unittest.TestCase):
+
+    """Test cases of the graph in compressed sparse row format."""
+
+    def setUp(self):
+        self.graph = CsrGraph([30, 10, 30, 20], [10, 20, 20, 40],
+                              [3, 1, None, 2])
+
+    def test_nodes_are_remapped(self):
+        """Show node ids are sorted and mapped to positions."""
+        self.assertEqual([10, 20, 30, 40], self.graph.nodes.tolist())
+        self.assertEqual({10: 0, 20: 1, 30: 2, 40: 3}, self.graph.index)
+        self.assertEqual(4, self.graph.node_count)
+        self.assertEqual(4, self.graph.edge_count)
+
+    def test_edges_are_grouped_by_tail(self):
+        """Show the edges are stored grouped by the positions of tails."""
+        self.assertEqual([0, 1, 2, 4, 4], self.graph.offsets.tolist())
+        self.assertEqual([1, 3, 0, 1], self.graph.heads.tolist())
+        self.assertEqual([1, 2, 3, 0], self.graph.weights.tolist())
+
+    def test_neighbors(self):
+        """Show neighbors are sliced per node."""
+        self.assertEqual([10, 20], self.graph.neighbors(30))
+        self.assertEqual([], self.graph.neighbors(40))
+        self.assertEqual([0, 1], self.graph.neighbor_positions(2).tolist())
+        self.assertEqual([3, 0], self.graph.neighbor_weights(2).tolist())
+        self.assertEqual(2, self.graph.degree(30))
+
+    def test_unweighted(self):
+        """Show an unweighted graph has no weights."""
+        self.assertIsNone(CsrGraph([1], [2]).weights)
+
+    def test_lines_to_csr_graph(self):
+        """Show a challenge reads lines into a CSR graph."""
+        challenge = Challenge()
+        challenge.lines = ['3', '1->2:5', '2->3, 4', '3->4:7']
+        graph = challenge.lines_to_csr_graph(1)
+        self.assertEqual([1, 2, 3, 4], graph.nodes.tolist())
+        self.assertEqual(4, graph.edge_count)
+        self.assertEqual([3, 4], graph.neighbors(2))
+        self.assertEqual([5, 0, 0, 7], graph.weights.tolist())
+        challenge.lines = ['1->2', '2->3']
+        self.assertIsNone(challenge.lines_to_csr_graph().weights)
@@ -0,0 +1,66 @@
+import os
+import time
+import unittest
+
+from challenges import Challenge
+from challenges.guard import LimitExceeded, run_guarded
+
+
+class Sleeping(Challenge):
+
+    """Challenge, that hangs in calc."""
+
+    def calc(self):
+        time.sleep(10)
+
+
+def run(report, challenge_class=Sleeping):
+    challenge = challenge_class()
+    challenge.phase_callback = report
+    challenge.main()
+    return challenge.output
+
+
+class GuardTestCase(unittest.TestCase):
+
+    """Test cases of the guarded execution in a child process."""
+
+    def test_result_is_returned(self):
+        """Show the value of the function is passed back."""
+        self.assertEqual('namespace()', run_guarded(
+            lambda report: run(report, Challenge), timeout=10))
+
+    def test_exception_is_raised_again(self):
+        """Show an exception of the child is raised in the parent."""
+        def fail(report):
+            raise KeyError('missing')
+        with self.assertRaises(KeyError):
+            run_guarded(fail, timeout=10)
+
+    def test_timeout_reports_phase(self):
+        """Show a hanging phase is stopped and reported."""
+        start = time.monotonic()
+        with self.assertRaises(LimitExceeded) as context:
+            run_guarded(run, timeout=0.5)
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual('timeout', context.exception.limit)
+        self.assertEqual('calc', context.exception.phase)
+        self.assertEqual('Timeout of 0.5 s exceeded in phase calc',
+                         str(context.exception))
+
+    def test_memory_limit(self):
+        """Show exceeding the address space is reported."""
+        def allocate(report):
+            report('build')
+            return len(bytearray(1 << 32))
+        with self.assertRaises(LimitExceeded) as context:
+            run_guarded(allocate, memory=512)
+        self.assertEqual('memory', context.exception.limit)
+        self.assertEqual('build', context.exception.phase)
+
+    def test_exit_is_reported(self):
+        """Show a dying child is reported with its exit code."""
+        with self.assertRaises(LimitExceeded) as context:
+            run_guarded(lambda report: os._exit(3))
+        self.assertEqual('exit', context.exception.limit)
+        self.assertEqual(3, context.exception.detail)
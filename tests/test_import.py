@@ -0,0 +1,67 @@
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+BUDGET = 0.2
+"""Generous limit of the cumulative import time in seconds."""
+
+
+def import_times(*arguments):
+    """Run python with -X importtime and collect the import times.
+
+    :return: dict, module names as keys and cumulative seconds as values
+    """
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime'] + list(arguments),
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        universal_newlines=True)
+    times = {}
+    for line in process.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, name = line[len('import time:'):].split('|')
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative) / 1000000
+    return times
+
+
+class ImportTestCase(unittest.TestCase):
+
+    """Guard the import cost of the library and the command."""
+
+    def test_import_of_challenge(self):
+        """Show importing Challenge doesn't pull in the runner."""
+        times = import_times('-c', 'from challenges import Challenge')
+        for module in ('argparse', 'glob', 'unittest', 'json', 'subprocess',
+                       'concurrent.futures', 'tracemalloc', 'numpy',
+                       'challenges.conf', 'challenges.runner'):
+            self.assertNotIn(module, times)
+        self.assertLess(times['challenges'], BUDGET)
+
+    def test_lazy_attributes(self):
+        """Show the runner is still available from the package."""
+        import challenges
+        from challenges.runner import Runner
+        self.assertIs(Runner, challenges.Runner)
+        self.assertTrue(callable(challenges.main))
+        with self.assertRaises(AttributeError):
+            challenges.Missing
+
+    def test_main_after_import_of_submodule(self):
+        """Show the submodule challenges.main doesn't shadow the function."""
+        process = subprocess.run(
+            [sys.executable, '-c', 'import challenges.main, challenges; '
+             'print(type(challenges.main).__name__)'],
+            cwd=ROOT, stdout=subprocess.PIPE, universal_newlines=True,
+            check=True)
+        self.assertEqual('function', process.stdout.strip())
+
+    def test_startup_of_command(self):
+        """Show the command imports modules of other modes lazily."""
+        times = import_times(os.path.join('bin', 'challenge'), '--version')
+        for module in ('unittest', 'json', 'subprocess', 'multiprocessing',
+                       'concurrent.futures', 'numpy'):
+            self.assertNotIn(module, times)
+        self.assertLess(times['challenges.runner'], BUDGET)
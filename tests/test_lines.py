@@ -0,0 +1,124 @@
+import os
+import tempfile
+import unittest
+
+from challenges import Challenge
+from challenges.lines import MappedLines, StreamLines, normalise
+
+
+class NormaliseTestCase(unittest.TestCase):
+
+    """Test cases of the normalisation of a text into lines."""
+
+    def test_lines_are_normalised(self):
+        """Show lines are stripped and empty head and tail are dropped."""
+        text = '\n  \n  one  \ntwo\n\n  three\n\n \n'
+        self.assertEqual(['one', 'two', '', 'three'], normalise(text))
+        self.assertEqual([b'one', b'two', b'', b'three'],
+                         normalise(text.encode()))
+        self.assertEqual([], normalise(' \n\n '))
+
+
+class StreamLinesTestCase(unittest.TestCase):
+
+    """Test cases of the lazily materialised line source."""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        with os.fdopen(handle, 'w') as pointer:
+            pointer.write('\n  one  \ntwo\n\n  three\n\n\n')
+        self.lines = StreamLines(self.path)
+
+    def tearDown(self):
+        self.lines.close()
+        os.remove(self.path)
+
+    def test_lines_are_read_lazily(self):
+        """Show lines are materialised just up to the requested index."""
+        self.assertEqual('one', self.lines[0])
+        self.assertEqual(['one'], self.lines._lines)
+        self.assertEqual('two', self.lines[1])
+        self.assertEqual(2, len(self.lines._lines))
+
+    def test_lines_are_normalised(self):
+        """Show lines are stripped like Challenge.example() does."""
+        self.assertEqual(['one', 'two', '', 'three'], list(self.lines))
+        self.assertEqual(4, len(self.lines))
+
+    def test_slices_and_negative_index(self):
+        """Show slices and negative indices are supported."""
+        self.assertEqual(['two', ''], self.lines[1:3])
+        self.assertEqual('three', self.lines[-1])
+        self.assertEqual(['', 'three'], self.lines[2:])
+
+    def test_index_error(self):
+        """Show reading behind the end raises an IndexError."""
+        with self.assertRaises(IndexError):
+            self.lines[4]
+
+    def test_challenge_reads_source(self):
+        """Show the challenge uses an injected source as lines."""
+        challenge = Challenge()
+        challenge.source = self.lines
+        challenge.read()
+        self.assertIs(self.lines, challenge.lines)
+        self.assertEqual([['two']], challenge.lines_to_words(1, 2))
+
+    def test_bytes(self):
+        """Show lines are read as bytes on request."""
+        lines = StreamLines(self.path, as_bytes=True)
+        self.assertEqual([b'one', b'two', b'', b'three'], list(lines))
+        lines.close()
+
+
+class MappedLinesTestCase(unittest.TestCase):
+
+    """Test cases of the memory mapped line source."""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        with os.fdopen(handle, 'w') as pointer:
+            pointer.write('\n  one  \ntwo\n\n  three\n\n\n')
+        self.lines = MappedLines(self.path)
+
+    def tearDown(self):
+        self.lines.close()
+        os.remove(self.path)
+
+    def test_offsets_are_indexed(self):
+        """Show the offsets of the lines are collected into an array."""
+        self.assertEqual('Q', self.lines._offsets.typecode)
+        self.assertEqual(4, len(self.lines))
+
+    def test_lines_are_normalised(self):
+        """Show lines are stripped like Challenge.example() does."""
+        self.assertEqual(['one', 'two', '', 'three'], list(self.lines))
+
+    def test_random_access(self):
+        """Show lines, slices and negative indices are accessible."""
+        self.assertEqual('two', self.lines[1])
+        self.assertEqual('three', self.lines[-1])
+        self.assertEqual(['two', ''], self.lines[1:3])
+        with self.assertRaises(IndexError):
+            self.lines[4]
+
+    def test_empty_file(self):
+        """Show an empty file has no lines."""
+        with open(self.path, 'w'):
+            pass
+        self.assertEqual([], list(MappedLines(self.path)))
+
+    def test_challenge_reads_source(self):
+        """Show the helpers of the challenge work on the mapped lines."""
+        challenge = Challenge()
+        challenge.source = self.lines
+        challenge.read()
+        self.assertEqual('three', challenge.line(3))
+        self.assertEqual(['two', ''], challenge.lines_to_list(1, 3))
+
+    def test_bytes(self):
+        """Show lines are not decoded on request."""
+        lines = MappedLines(self.path, as_bytes=True)
+        self.assertEqual([b'one', b'two', b'', b'three'], list(lines))
+        self.assertEqual(b'three', lines[-1])
+        lines.close()
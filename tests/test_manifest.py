@@ -0,0 +1,63 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from challenges.manifest import Manifest
+
+
+class ManifestTestCase(unittest.TestCase):
+
+    """Test cases of the cached index of challenge directories."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        for directory in ('First', 'Second', '_private', 'lower'):
+            os.makedirs(os.path.join(self.root, directory))
+        self.touch('First', 'challenge.py')
+        self.touch('First', 'test.py')
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def touch(self, *path):
+        with open(os.path.join(self.root, *path), 'w'):
+            pass
+
+    def test_update_lists_challenges(self):
+        """Show capitalised directories are indexed."""
+        manifest = Manifest(self.root).load().update()
+        self.assertEqual({'First', 'Second'}, set(manifest.entries))
+        entry = manifest.entries['First']
+        self.assertEqual('First.challenge', entry['module'])
+        self.assertEqual('First.test', entry['unittest'])
+        self.assertFalse(entry['sample'])
+        self.assertIsNone(manifest.entries['Second']['module'])
+
+    def test_manifest_is_saved_and_reused(self):
+        """Show unchanged directories are taken from the saved manifest."""
+        manifest = Manifest(self.root).load().update()
+        manifest.save()
+        self.assertTrue(os.path.exists(manifest.path))
+        manifest = Manifest(self.root).load().update()
+        self.assertFalse(manifest.changed)
+
+    def test_changed_directories_are_rescanned(self):
+        """Show added files and removed directories are detected."""
+        manifest = Manifest(self.root).load().update()
+        manifest.save()
+        self.touch('First', 'sample.txt')
+        os.utime(os.path.join(self.root, 'First'), (0, 0))
+        shutil.rmtree(os.path.join(self.root, 'Second'))
+        manifest = Manifest(self.root).load().update()
+        self.assertTrue(manifest.entries['First']['sample'])
+        self.assertNotIn('Second', manifest.entries)
+
+    def test_refresh_single_challenge(self):
+        """Show a single challenge is indexed without listing the root."""
+        manifest = Manifest(self.root)
+        self.assertEqual('First.challenge',
+                         manifest.refresh('First')['module'])
+        self.assertIsNone(manifest.refresh('Missing'))
+        self.assertIsNone(manifest.refresh('lower'))
+        self.assertEqual(['First'], list(manifest.entries))
@@ -0,0 +1,111 @@
+import unittest
+
+from challenges import Challenge
+from challenges.memo import memoize, stats, trampoline
+
+
+class Tree(Challenge):
+
+    """Challenge with memoized and trampolined methods."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    @memoize(maxsize=2)
+    def square(self, n, plus=0):
+        self.calls += 1
+        return n * n + plus
+
+    @trampoline
+    def depth(self, n):
+        if n == 0:
+            return 0
+        return (yield self.depth(n - 1)) + 1
+
+    @memoize(maxsize=None)
+    @trampoline
+    def fibonacci(self, n):
+        if n < 2:
+            return n
+        return (yield self.fibonacci(n - 1)) + (yield self.fibonacci(n - 2))
+
+    @trampoline
+    def depths(self, n):
+        """Sum of the depths up to n, calling another trampoline."""
+        if n == 0:
+            return 0
+        return (yield self.depths(n - 1)) + self.depth(n)
+
+
+class MemoTestCase(unittest.TestCase):
+
+    """Test cases of memoization and explicit stack recursion."""
+
+    def test_memoize_hits_and_misses(self):
+        """Show repeated arguments are answered from the cache."""
+        tree = Tree()
+        misses, hits = Tree.square.misses, Tree.square.hits
+        self.assertEqual(9, tree.square(3))
+        self.assertEqual(9, tree.square(3))
+        self.assertEqual(10, tree.square(3, plus=1))
+        self.assertEqual(2, tree.calls)
+        self.assertEqual(misses + 2, Tree.square.misses)
+        self.assertEqual(hits + 1, Tree.square.hits)
+        self.assertIn(Tree.square, stats())
+
+    def test_memoize_is_per_instance_and_bounded(self):
+        """Show the cache is not shared and evicts the least recently used."""
+        tree, other = Tree(), Tree()
+        evictions = Tree.square.evictions
+        tree.square(1)
+        tree.square(2)
+        tree.square(1)
+        tree.square(3)  # Evicts 2
+        self.assertEqual(evictions + 1, Tree.square.evictions)
+        tree.square(1)
+        self.assertEqual(3, tree.calls)
+        tree.square(2)
+        self.assertEqual(4, tree.calls)
+        other.square(1)
+        self.assertEqual(1, other.calls)
+
+    def test_keywords_are_not_positional_arguments(self):
+        """Show a keyword argument doesn't hit a positional tuple."""
+        class Pairs(Challenge):
+            @memoize()
+            def pair(self, *args, **kwargs):
+                return args, kwargs
+        pairs = Pairs()
+        self.assertEqual(((1, ('b', 2)), {}), pairs.pair(1, ('b', 2)))
+        self.assertEqual(((1,), {'b': 2}), pairs.pair(1, b=2))
+
+    def test_override_has_a_cache_of_its_own(self):
+        """Show a memoized override doesn't share the cache of its base."""
+        class Base(Challenge):
+            @memoize()
+            def name(self, n):
+                return 'A' + str(n)
+
+        class Derived(Base):
+            @memoize()
+            def name(self, n):
+                return 'B' + Base.name(self, n)
+        derived = Derived()
+        self.assertEqual('BA1', derived.name(1))
+        self.assertEqual('A1', Base.name(derived, 1))
+
+    def test_trampoline_beyond_recursion_limit(self):
+        """Show a recursion deeper than the C stack allows."""
+        self.assertEqual(100000, Tree().depth(100000))
+
+    def test_trampoline_calls_other_trampoline(self):
+        """Show another trampoline returns its value within a running one."""
+        self.assertEqual(5050, Tree().depths(100))
+
+    def test_memoize_on_trampoline(self):
+        """Show memoized steps of a running trampoline."""
+        tree = Tree()
+        self.assertEqual(354224848179261915075, tree.fibonacci(100))
+        self.assertEqual(12586269025, tree.fibonacci(50))
+        self.assertEqual(101, len(tree.__dict__[Tree.fibonacci.attribute]))
@@ -0,0 +1,87 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from challenges.output import Tee, copy_if_changed, link_or_copy
+
+
+class TeeTestCase(unittest.TestCase):
+
+    """Test cases of the writer of output to many destinations."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.paths = [os.path.join(self.root, name)
+                      for name in ('latest.txt', 'result.txt')]
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def read(self, path):
+        with open(path) as pointer:
+            return pointer.read()
+
+    def test_chunks_are_written_to_all(self):
+        """Show each chunk goes to the stream and all files."""
+        stream = io.StringIO()
+        with Tee(self.paths, stream) as writer:
+            writer.write('Hello ')
+            writer.write('World')
+        self.assertEqual('Hello World\n', stream.getvalue())
+        for path in self.paths:
+            self.assertEqual('Hello World', self.read(path))
+        self.assertEqual(['latest.txt', 'result.txt'],
+                         sorted(os.listdir(self.root)))
+
+    def test_failure_keeps_previous_files(self):
+        """Show an error discards the written files."""
+        with Tee(self.paths) as writer:
+            writer.write('old')
+        with self.assertRaises(ValueError):
+            with Tee(self.paths) as writer:
+                writer.write('new')
+                raise ValueError
+        for path in self.paths:
+            self.assertEqual('old', self.read(path))
+        self.assertEqual(2, len(os.listdir(self.root)))
+
+    def test_unchanged_file_is_not_written(self):
+        """Show a file with the same content keeps its inode and mtime."""
+        for content in ('Hello World', 'Hello', 'Hello World!', 'Hallo'):
+            with Tee(self.paths[:1]) as writer:
+                writer.write('Hello World')
+            status = os.stat(self.paths[0])
+            os.utime(self.paths[0], (1, 1))
+            with Tee(self.paths[:1]) as writer:
+                writer.write(content[:5])
+                writer.write(content[5:])
+            self.assertEqual(content, self.read(self.paths[0]))
+            unchanged = os.stat(self.paths[0])
+            if content == 'Hello World':
+                self.assertEqual(status.st_ino, unchanged.st_ino)
+                self.assertEqual(1, unchanged.st_mtime)
+            else:
+                self.assertNotEqual(1, unchanged.st_mtime)
+
+    def test_link_or_copy(self):
+        """Show the target is linked to the source."""
+        source, target = self.paths
+        with Tee([source]) as writer:
+            writer.write('one')
+        link_or_copy(source, target)
+        self.assertTrue(os.path.samefile(source, target))
+        with Tee([source]) as writer:
+            writer.write('two')
+        link_or_copy(source, target)
+        self.assertEqual('two', self.read(target))
+
+    def test_copy_if_changed(self):
+        """Show an equal target is not copied again."""
+        source, target = self.paths
+        with Tee([source]) as writer:
+            writer.write('one')
+        self.assertTrue(copy_if_changed(source, target))
+        self.assertFalse(copy_if_changed(source, target))
+        self.assertEqual('one', self.read(target))
@@ -0,0 +1,39 @@
+import sys
+import unittest
+from unittest import mock
+
+from challenges.sequence import best_match, hamming, match_count, \
+    match_counts
+
+
+class SequenceTestCase(unittest.TestCase):
+
+    """Test cases of the sequence comparison kernels."""
+
+    def test_match_count(self):
+        """Show matching positions are counted up to the shorter length."""
+        self.assertEqual(2, match_count('ACGT', 'AGG'))
+        self.assertEqual(4, match_count(b'ACGT', bytearray(b'ACGT')))
+
+    def test_hamming(self):
+        """Show differing positions are counted."""
+        self.assertEqual(2, hamming('ACGT', 'AGGA'))
+        with self.assertRaises(ValueError):
+            hamming('ACGT', 'ACG')
+
+    def test_match_counts(self):
+        """Show reads of different lengths are compared in a batch."""
+        reads = ['ACCGGTCC', 'ACC', 'TTTTTTTTTT', '']
+        self.assertEqual([8, 3, 1, 0], match_counts('ACCGGTCC', reads))
+
+    def test_match_counts_without_numpy(self):
+        """Show the batch falls back to pure Python without NumPy."""
+        reads = ['ACCGGTCC', 'ACC', 'TTTTTTTTTT', '']
+        with mock.patch.dict(sys.modules, {'numpy': None}):
+            self.assertEqual([8, 3, 1, 0], match_counts('ACCGGTCC', reads))
+
+    def test_best_match(self):
+        """Show the first record with the most matches wins."""
+        records = [('one', 'AAAA'), ('two', 'ACAA'), ('three', 'ACAA')]
+        self.assertEqual('two', best_match('ACGT', records))
+        self.assertIsNone(best_match('ACGT', [('one', 'TTTA')]))
@@ -0,0 +1,81 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace as namespace
+from unittest import mock
+
+from challenges.lines import StreamLines
+from challenges.server import Server
+
+CHALLENGE = '''
+from challenges import Challenge
+
+class ServedChallenge(Challenge):
+
+    def calc(self):
+        self.result = {!r}
+'''
+
+
+class ServerTestCase(unittest.TestCase):
+
+    """Test cases of the persistent challenge server."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.root, 'Served'))
+        with open(os.path.join(self.root, 'Served', '__init__.py'), 'w'):
+            pass
+        self.path = os.path.join(self.root, 'Served', 'challenge.py')
+        self.write('first')
+        sys.path.insert(0, self.root)
+        self.server = Server(namespace(root=self.root))
+
+    def tearDown(self):
+        sys.path.remove(self.root)
+        for name in ('Served', 'Served.challenge'):
+            sys.modules.pop(name, None)
+        shutil.rmtree(self.root)
+
+    def write(self, result, mtime=None):
+        with open(self.path, 'w') as pointer:
+            pointer.write(CHALLENGE.format(result))
+        if mtime:
+            os.utime(self.path, (mtime, mtime))
+
+    def test_respond(self):
+        """Show a request is answered with output and timings."""
+        response = self.server.respond({'challenge': 'Served',
+                                        'sample': 'x'})
+        self.assertIsNone(response['error'])
+        self.assertEqual('first', response['output'])
+        self.assertEqual(['read', 'build', 'calc', 'format'],
+                         list(response['timings']))
+
+    def test_respond_closes_source(self):
+        """Show a streamed file is closed after the request."""
+        data = os.path.join(self.root, 'data.txt')
+        with open(data, 'w') as pointer:
+            pointer.write('1\n2\n')
+        with mock.patch.object(StreamLines, 'close', autospec=True,
+                               side_effect=StreamLines.close) as closed:
+            response = self.server.respond({'challenge': 'Served',
+                                            'file': data, 'mode': 'stream'})
+        self.assertIsNone(response['error'])
+        closed.assert_called()
+
+    def test_respond_with_error(self):
+        """Show errors are reported in the response."""
+        response = self.server.respond({'challenge': 'Missing'})
+        self.assertIn('FileNotFoundError', response['error'])
+
+    def test_module_is_reloaded_if_changed(self):
+        """Show the module is reloaded just if its file changed."""
+        klass = self.server.get_class('Served')
+        self.assertIs(klass, self.server.get_class('Served'))
+        self.write('second', mtime=os.stat(self.path).st_mtime + 10)
+        self.assertEqual('second',
+                         self.server.respond({'challenge': 'Served',
+                                              'sample': 'x'})['output'])
@@ -0,0 +1,30 @@
+import unittest
+
+from challenges.suite import run_module
+
+
+class SuiteTestCase(unittest.TestCase):
+
+    """Test cases of the parallel unittest worker."""
+
+    def test_run_module(self):
+        """Show a test case is run and each test is timed."""
+        result = run_module('HelloWorld.test.HelloWorldTest')
+        self.assertTrue(result['successful'])
+        self.assertEqual(result['tests'], len(result['timings']))
+        test, seconds = result['timings'][0]
+        self.assertTrue(test.startswith('HelloWorld.test.HelloWorldTest.'))
+        self.assertGreaterEqual(seconds, 0)
+
+    def test_run_module_reports_failures(self):
+        """Show failures are reported instead of raising."""
+        result = run_module('tests.failing.Failing')
+        self.assertFalse(result['successful'])
+        self.assertEqual(2, result['tests'])
+        self.assertIn('on purpose', result['report'])
+
+    def test_run_module_reports_import_errors(self):
+        """Show a missing test case is reported as failure."""
+        result = run_module('HelloWorld.test.Missing')
+        self.assertFalse(result['successful'])
+        self.assertIn('AttributeError', result['report'])